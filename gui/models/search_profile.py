@@ -605,8 +605,19 @@ class SearchProfile:
         Returns:
             str: Categoría de éxito
         """
-        percentage = self.get_success_percentage()
+        return self._categorize_success(self.get_success_percentage())
+
+    @staticmethod
+    def _categorize_success(percentage):
+        """
+        Clasifica un porcentaje de éxito ya calculado.
+
+        Args:
+            percentage (float): Porcentaje de éxito o None sin seguimiento
 
+        Returns:
+            str: Categoría de éxito
+        """
         if percentage is None:
             return "sin_seguimiento"
         elif percentage >= 100:
@@ -647,7 +658,8 @@ class SearchProfile:
         if percentage is None:
             return "➖ N/A"
 
-        category = self.get_success_category()
+        # Reutilizar el porcentaje ya calculado en lugar de recalcularlo
+        category = self._categorize_success(percentage)
         emoji_map = {
             "optimo": "✅",
             "alto": "📊",
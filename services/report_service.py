@@ -6,19 +6,125 @@ con formato condicional por rangos y generación de reportes diarios, semanales
 y mensuales con cálculo correcto de porcentajes de éxito basados en objetivos.
 """
 
-import os
 import glob
+import io
+import os
+from zipfile import ZipFile, ZIP_DEFLATED
+from functools import cached_property
 from pathlib import Path
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, timezone
 import calendar
-
-try:
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-    from openpyxl.formatting.rule import CellIsRule
-except ImportError:
-    openpyxl = None
+import csv
+
+# openpyxl se importa la primera vez que se genera un reporte (ver _load_openpyxl).
+# Hasta entonces estos nombres valen None; _load_openpyxl los asigna
+openpyxl = None
+_openpyxl_loaded = False
+Font = PatternFill = Alignment = Border = Side = NamedStyle = DEFAULT_FONT = None
+WriteOnlyCell = ExcelWriter = None
+
+# Estilos compartidos por todas las celdas, construidos por _load_openpyxl
+_CENTER_ALIGNMENT = None
+_CENTER_MIDDLE_ALIGNMENT = None
+_THIN_SIDE = None
+_THIN_BORDER = None
+_REPORT_STYLES = None
+
+
+def _load_openpyxl():
+    """
+    Importa openpyxl y construye los estilos compartidos en el primer uso.
+
+    Returns:
+        bool: True si openpyxl está disponible
+    """
+    global openpyxl, _openpyxl_loaded
+    global Font, PatternFill, Alignment, Border, Side, NamedStyle, DEFAULT_FONT
+    global WriteOnlyCell, ExcelWriter
+    global _CENTER_ALIGNMENT, _CENTER_MIDDLE_ALIGNMENT, _THIN_SIDE, _THIN_BORDER, _REPORT_STYLES
+
+    if _openpyxl_loaded:
+        return openpyxl is not None
+    _openpyxl_loaded = True
+
+    try:
+        import openpyxl as _openpyxl
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+        from openpyxl.styles.fonts import DEFAULT_FONT
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.writer.excel import ExcelWriter
+    except ImportError:
+        return False
+
+    # Estilos compartidos: se construyen una sola vez y se reutilizan en cada celda
+    _CENTER_ALIGNMENT = Alignment(horizontal="center")
+    _CENTER_MIDDLE_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+    _THIN_SIDE = Side(border_style="thin", color="000000")
+    _THIN_BORDER = Border(top=_THIN_SIDE, bottom=_THIN_SIDE, left=_THIN_SIDE, right=_THIN_SIDE)
+    _REPORT_STYLES = {
+        'title_font': Font(bold=True, size=16, color="FFFFFF"),
+        'title_fill': PatternFill(start_color="FF2E5090", end_color="FF2E5090", fill_type="solid"),
+        'title_alignment': _CENTER_MIDDLE_ALIGNMENT,
+        'subtitle_font': Font(bold=True, size=12, color="000000"),
+        'subtitle_alignment': _CENTER_MIDDLE_ALIGNMENT,
+        'header_font': Font(bold=True, color="FFFFFF"),
+        'header_fill': PatternFill(start_color="FF366092", end_color="FF366092", fill_type="solid"),
+        'header_alignment': _CENTER_MIDDLE_ALIGNMENT,
+        'bot_fill': PatternFill(start_color="FFFFC0CB", end_color="FFFFC0CB", fill_type="solid"),
+        'bot_font': Font(bold=True, color="C71585"),
+        'border': _THIN_BORDER
+    }
+    _SUMMARY_FONTS.update({
+        'title': Font(bold=True, size=16, color="366092"),
+        'section': Font(bold=True, size=14, color="006400"),
+        'label': Font(bold=True),
+    })
+
+    openpyxl = _openpyxl
+    return True
+
+
+# Textos y formatos compartidos por todas las filas de los reportes
+_DATETIME_FORMAT = "%d/%m/%Y %H:%M:%S"
+_DATE_FORMAT = "%d/%m/%Y"
+_BOT_MARK = "X"
+_EMPTY_TEXT = "—"
+_NEVER_TEXT = "Nunca"
+
+# Encabezados de la tabla de perfiles (fila 4), compartidos por los tres reportes
+_TABLE_HEADERS = (
+    "Nombre del Perfil",
+    "Responsable",
+    "Última Actualización",
+    "Fecha de entrega",
+    "Cantidad de ejecuciones",
+    "Cantidad de Ejecuciones recomendadas",
+    "Porcentaje de Éxito",
+    "Bot Automático",
+    "Bot Manual",
+    "Bot Offline",
+    "Última Búsqueda",
+)
+
+# Nivel de compresión zlib del archivo .xlsx: el nivel 1 comprime varias veces más
+# rápido que el nivel por defecto con archivos apenas más grandes
+_ZIP_COMPRESSLEVEL = 1
+
+# Estilos con nombre registrados en cada libro para las celdas de datos
+_DATA_STYLE = "datos"
+_DATA_CENTER_STYLE = "datos_centrados"
+
+# Estilos con nombre para el título, subtítulo y encabezados de tabla
+_TITLE_STYLE = "titulo"
+_SUBTITLE_STYLE = "subtitulo"
+_HEADER_STYLE = "encabezado"
+_BORDER_STYLE = "borde"
+
+# Rellenos y fuentes de porcentaje de éxito, indexados por (color_relleno, color_fuente)
+_SUCCESS_STYLE_CACHE = {}
+
+# Fuentes de las hojas de resumen, construidas una sola vez por _load_openpyxl
+_SUMMARY_FONTS = {}
 
 
 class ReportService:
@@ -27,52 +133,100 @@ class ReportService:
     def __init__(self):
         """Inicializa el servicio de reportes."""
         self.reports_dir = Path("reports")
-        os.makedirs(self.reports_dir, exist_ok=True)
+        self._reports_dir_ready = False
 
-    def generate_profiles_report(self, profiles):
+    def generate_profiles_report(self, profiles, fmt="xlsx"):
         """
         Genera un reporte Excel diario con información esencial de perfiles.
 
         Args:
             profiles (list): Lista de perfiles de búsqueda
+            fmt (str): "xlsx" (por defecto) o "csv" para un volcado tabular sin
+                estilos ni hoja de resumen, que no requiere openpyxl
 
         Returns:
-            str: Ruta del archivo Excel generado
+            str: Ruta del archivo generado
         """
-        if openpyxl is None:
+        if fmt == "csv":
+            return self._generate_profiles_csv(profiles)
+        if fmt != "xlsx":
+            raise Exception(f"Formato de reporte no soportado: {fmt}")
+
+        if not _load_openpyxl():
             raise Exception("openpyxl no está instalado. Ejecute: pip install openpyxl")
 
+        # Tomar la hora de generación una sola vez para nombre, encabezado y resumen
+        generated_at = datetime.now()
+        current_date = generated_at.strftime(_DATETIME_FORMAT)
+        timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
+
+        self._ensure_reports_dir()
+
         # Crear nombre de archivo con timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"reporte_perfiles_{timestamp}.xlsx"
         file_path = self.reports_dir / filename
 
-        # Crear libro de trabajo
-        workbook = openpyxl.Workbook()
-        worksheet = workbook.active
-        worksheet.title = "Perfiles de Búsqueda"
+        # Crear libro de trabajo en modo de solo escritura: las filas se envían al
+        # archivo a medida que se agregan en lugar de retener cada celda en memoria
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Perfiles de Búsqueda")
 
         # Configurar estilos
-        styles = self._get_report_styles()
+        styles = _REPORT_STYLES
+        self._register_named_styles(workbook, styles)
+
+        # Ajustar formato (debe definirse antes de escribir filas)
+        self._format_daily_worksheet(worksheet)
 
         # Crear título general
-        self._add_daily_header(worksheet, len(profiles), styles)
+        self._add_daily_header(worksheet, len(profiles), styles, current_date)
 
         # Configurar encabezados de tabla
         self._add_table_headers(worksheet, styles)
 
         # Escribir datos de perfiles
-        self._add_profile_data(worksheet, profiles, styles)
-
-        # Ajustar formato
-        self._format_daily_worksheet(worksheet)
+        self._add_profile_data(worksheet, self._build_daily_rows(profiles), styles)
 
         # Agregar hoja de resumen
         summary_sheet = workbook.create_sheet("Resumen")
-        self._add_summary_sheet(summary_sheet, profiles)
+        self._add_summary_sheet(summary_sheet, profiles, current_date)
 
         # Guardar archivo
-        workbook.save(file_path)
+        self._save_workbook(workbook, file_path)
+        return str(file_path)
+
+    def _generate_profiles_csv(self, profiles):
+        """
+        Genera el reporte diario como CSV (UTF-8 con BOM para abrirlo en Excel).
+
+        Args:
+            profiles (list): Lista de perfiles de búsqueda
+
+        Returns:
+            str: Ruta del archivo CSV generado
+        """
+        self._ensure_reports_dir()
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_path = self.reports_dir / f"reporte_perfiles_{timestamp}.csv"
+
+        with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(_TABLE_HEADERS)
+            writer.writerows(
+                (
+                    name, responsable, last_update, delivery_date, found_emails, optimal_display,
+                    success_display,
+                    _BOT_MARK if is_automatic else "",
+                    _BOT_MARK if is_manual else "",
+                    _BOT_MARK if is_offline else "",
+                    last_search,
+                )
+                for (name, responsable, last_update, delivery_date, found_emails, optimal_display,
+                     success_display, _, is_automatic, is_manual, is_offline,
+                     last_search) in self._build_daily_rows(profiles)
+            )
+
         return str(file_path)
 
     def generate_weekly_profiles_report(self):
@@ -83,11 +237,13 @@ class ReportService:
         Returns:
             str: Ruta del archivo Excel generado
         """
-        if openpyxl is None:
+        if not _load_openpyxl():
             raise Exception("openpyxl no está instalado. Ejecute: pip install openpyxl")
 
         # Obtener fechas de la semana actual
-        today = datetime.now().date()
+        generated_at = datetime.now()
+        current_date = generated_at.strftime(_DATETIME_FORMAT)
+        today = generated_at.date()
         start_of_week = today - timedelta(days=today.weekday())
         end_of_week = start_of_week + timedelta(days=6)
 
@@ -98,27 +254,30 @@ class ReportService:
             raise Exception("No se encontraron reportes diarios para la semana actual")
 
         # Crear archivo de reporte semanal
-        file_path = self._create_weekly_file(start_of_week, end_of_week)
+        file_path = self._create_weekly_file(start_of_week, end_of_week, generated_at)
 
         # Generar reporte
-        workbook = openpyxl.Workbook()
-        worksheet = workbook.active
-        worksheet.title = "Reporte Semanal"
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Reporte Semanal")
 
         # Configurar estilos
-        styles = self._get_report_styles()
+        styles = _REPORT_STYLES
+        self._register_named_styles(workbook, styles)
 
         # Crear contenido del reporte
-        self._add_weekly_header(worksheet, start_of_week, end_of_week, len(weekly_data['aggregated_data']), styles)
+        self._format_daily_worksheet(worksheet)
+        self._add_weekly_header(
+            worksheet, start_of_week, end_of_week, len(weekly_data['aggregated_data']), styles, current_date
+        )
         self._add_table_headers(worksheet, styles)
         self._add_weekly_profile_data(worksheet, weekly_data['aggregated_data'], styles)
-        self._format_daily_worksheet(worksheet)
 
         # Agregar resumen semanal
         summary_sheet = workbook.create_sheet("Resumen Semanal")
-        self._add_weekly_summary_sheet(summary_sheet, weekly_data, start_of_week, end_of_week)
+        self._add_weekly_summary_sheet(summary_sheet, weekly_data, start_of_week, end_of_week, current_date)
 
-        workbook.save(file_path)
+        self._ensure_reports_dir()
+        self._save_workbook(workbook, file_path)
         return str(file_path)
 
     def generate_monthly_profiles_report(self):
@@ -129,11 +288,13 @@ class ReportService:
         Returns:
             str: Ruta del archivo Excel generado
         """
-        if openpyxl is None:
+        if not _load_openpyxl():
             raise Exception("openpyxl no está instalado. Ejecute: pip install openpyxl")
 
         # Obtener fechas del mes actual
-        today = datetime.now().date()
+        generated_at = datetime.now()
+        current_date = generated_at.strftime(_DATETIME_FORMAT)
+        today = generated_at.date()
         # Primer día del mes
         start_of_month = date(today.year, today.month, 1)
         # Último día del mes
@@ -147,183 +308,156 @@ class ReportService:
             raise Exception("No se encontraron reportes diarios para el mes actual")
 
         # Crear archivo de reporte mensual
-        file_path = self._create_monthly_file(start_of_month, end_of_month)
+        file_path = self._create_monthly_file(start_of_month, end_of_month, generated_at)
 
         # Generar reporte
-        workbook = openpyxl.Workbook()
-        worksheet = workbook.active
-        worksheet.title = "Reporte Mensual"
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Reporte Mensual")
 
         # Configurar estilos
-        styles = self._get_report_styles()
+        styles = _REPORT_STYLES
+        self._register_named_styles(workbook, styles)
 
         # Crear contenido del reporte
-        self._add_monthly_header(worksheet, start_of_month, end_of_month, len(monthly_data['aggregated_data']), styles)
+        self._format_daily_worksheet(worksheet)
+        self._add_monthly_header(
+            worksheet, start_of_month, end_of_month, len(monthly_data['aggregated_data']), styles, current_date
+        )
         self._add_table_headers(worksheet, styles)
         self._add_monthly_profile_data(worksheet, monthly_data['aggregated_data'], styles)
-        self._format_daily_worksheet(worksheet)
 
         # Agregar resumen mensual
         summary_sheet = workbook.create_sheet("Resumen Mensual")
-        self._add_monthly_summary_sheet(summary_sheet, monthly_data, start_of_month, end_of_month)
+        self._add_monthly_summary_sheet(
+            summary_sheet, monthly_data, start_of_month, end_of_month, current_date
+        )
 
-        workbook.save(file_path)
+        self._ensure_reports_dir()
+        self._save_workbook(workbook, file_path)
         return str(file_path)
 
-    def _get_header_map(self, worksheet):
-        """Obtiene un mapa de encabezados a columnas para manejo flexible de reportes."""
+    def _save_workbook(self, workbook, file_path):
+        """
+        Guarda el libro como hace openpyxl, pero con compresión zlib rápida.
+
+        El archivo se arma en memoria y se escribe en disco con una sola escritura
+        sobre un archivo temporal que luego se renombra, de modo que la agregación
+        semanal/mensual nunca lee un reporte diario a medio escribir.
+
+        Args:
+            workbook: Libro de openpyxl a guardar
+            file_path (Path): Ruta del archivo .xlsx
+        """
+        buffer = io.BytesIO()
+        archive = ZipFile(
+            buffer, 'w', ZIP_DEFLATED, allowZip64=True, compresslevel=_ZIP_COMPRESSLEVEL
+        )
+        workbook.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+        ExcelWriter(workbook, archive).save()
+
+        temp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            temp_path.write_bytes(buffer.getbuffer())
+            os.replace(temp_path, file_path)
+        except Exception:
+            # No dejar un archivo temporal a medio escribir en reports/
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _ensure_reports_dir(self):
+        """Crea el directorio de reportes antes de escribir el primer archivo."""
+        if not self._reports_dir_ready:
+            self.reports_dir.mkdir(parents=True, exist_ok=True)
+            self._reports_dir_ready = True
+
+    def _get_header_map(self, header_values):
+        """
+        Obtiene un mapa de encabezados a columnas para manejo flexible de reportes.
+
+        Args:
+            header_values (tuple): Valores de la fila de encabezados (fila 4)
+
+        Returns:
+            dict: Encabezado en minúsculas -> índice de columna (base 0)
+        """
         header_map = {}
-        header_row = 4
-        for col in range(1, worksheet.max_column + 1):
-            value = worksheet.cell(row=header_row, column=col).value
+        for col, value in enumerate(header_values):
             if isinstance(value, str) and value.strip():
                 header_map[value.strip().lower()] = col
         return header_map
 
+    def _row_value(self, values, col, default=None):
+        """Obtiene el valor de una columna de la fila, o el valor por defecto si no existe."""
+        if col is None or col >= len(values):
+            return default
+        return values[col]
+
     def _process_weekly_reports(self, start_of_week, end_of_week):
         """Procesa los reportes diarios de la semana y agrega los datos correctamente."""
-        weekly_reports = []
+        return self._aggregate_daily_reports(start_of_week, end_of_week, 'weekly_optimal', 7)
+
+    def _process_monthly_reports(self, start_of_month, end_of_month):
+        """Procesa los reportes diarios del mes y agrega los datos correctamente."""
+        # Calcular el número de días en el mes
+        days_in_month = (end_of_month - start_of_month).days + 1
+
+        monthly_data = self._aggregate_daily_reports(
+            start_of_month, end_of_month, 'monthly_optimal', days_in_month
+        )
+        monthly_data['days_in_month'] = days_in_month
+        return monthly_data
+
+    def _find_daily_reports(self, start_date, end_date):
+        """Busca los reportes diarios cuya fecha de archivo cae dentro del período."""
+        period_reports = []
         pattern = str(self.reports_dir / "reporte_perfiles_*.xlsx")
 
-        # Buscar archivos de la semana
         for file_path in glob.glob(pattern):
             try:
-                file_name = os.path.basename(file_path)
+                file_name = Path(file_path).name
                 date_part = file_name.split('_')[2].split('.')[0][:8]
                 file_date = datetime.strptime(date_part, "%Y%m%d").date()
 
-                if start_of_week <= file_date <= end_of_week:
-                    weekly_reports.append(file_path)
+                if start_date <= file_date <= end_date:
+                    period_reports.append(file_path)
             except (ValueError, IndexError):
                 continue
 
-        # Procesar datos agregados
-        aggregated_data = {}
-
-        for report_path in weekly_reports:
-            try:
-                wb = openpyxl.load_workbook(report_path, data_only=True)
-                ws = wb.active
-
-                header_map = self._get_header_map(ws)
-                name_col = header_map.get("nombre del perfil")
-                executions_col = header_map.get("cantidad de ejecuciones")
-                optimal_col = header_map.get("cantidad de ejecuciones recomendadas")
-                automatic_col = header_map.get("bot automático")
-                manual_col = header_map.get("bot manual")
-                offline_col = header_map.get("bot offline")
-                last_search_col = header_map.get("última búsqueda")
-                responsable_col = header_map.get("responsable")
-                last_update_col = header_map.get("última actualización")
-                delivery_col = header_map.get("fecha de entrega")
-
-                if not name_col or not executions_col or not optimal_col:
-                    continue
-
-                for row in range(5, ws.max_row + 1):
-                    profile_name = ws.cell(row=row, column=name_col).value
-                    if not profile_name:
-                        continue
-
-                    responsable = ws.cell(row=row, column=responsable_col).value if responsable_col else ""
-                    executions = ws.cell(row=row, column=executions_col).value or 0
-                    optimal_cell = ws.cell(row=row, column=optimal_col).value
-                    is_automatic = bool(automatic_col and ws.cell(row=row, column=automatic_col).value == "X")
-                    is_manual = bool(manual_col and ws.cell(row=row, column=manual_col).value == "X")
-                    is_offline = bool(offline_col and ws.cell(row=row, column=offline_col).value == "X")
-                    last_search = ws.cell(row=row, column=last_search_col).value if last_search_col else None
-                    last_update_text = ws.cell(row=row, column=last_update_col).value if last_update_col else ""
-                    delivery_date_text = ws.cell(row=row, column=delivery_col).value if delivery_col else ""
-
-                    if isinstance(last_update_text, str) and last_update_text.strip() == "—":
-                        last_update_text = ""
-                    if isinstance(delivery_date_text, str) and delivery_date_text.strip() == "—":
-                        delivery_date_text = ""
-
-                    # Procesar ejecuciones óptimas
-                    daily_optimal = self._extract_optimal_value(optimal_cell)
-                    has_tracking = daily_optimal > 0
-
-                    if profile_name not in aggregated_data:
-                        aggregated_data[profile_name] = {
-                            'executions': 0,
-                            'daily_optimal': daily_optimal,
-                            'weekly_optimal': daily_optimal * 7 if has_tracking else 0,
-                            'has_tracking': has_tracking,
-                            'is_automatic': is_automatic,
-                            'is_manual': is_manual,
-                            'is_offline': is_offline,
-                            'last_search': last_search,
-                            'responsable': responsable,
-                            'last_update_text': last_update_text or "",
-                            'delivery_date_text': delivery_date_text or ""
-                        }
-                    else:
-                        if responsable and not aggregated_data[profile_name].get('responsable'):
-                            aggregated_data[profile_name]['responsable'] = responsable
-                        aggregated_data[profile_name]['is_automatic'] = (
-                            aggregated_data[profile_name]['is_automatic'] or is_automatic
-                        )
-                        aggregated_data[profile_name]['is_manual'] = (
-                            aggregated_data[profile_name]['is_manual'] or is_manual
-                        )
-                        aggregated_data[profile_name]['is_offline'] = (
-                            aggregated_data[profile_name].get('is_offline', False) or is_offline
-                        )
-
-                        if last_update_text:
-                            aggregated_data[profile_name]['last_update_text'] = last_update_text
-
-                        if delivery_date_text:
-                            aggregated_data[profile_name]['delivery_date_text'] = delivery_date_text
-
-                    # Acumular ejecuciones
-                    aggregated_data[profile_name]['executions'] += executions
-
-                    # Actualizar última búsqueda si es más reciente
-                    if last_search and (not aggregated_data[profile_name]['last_search'] or
-                                        last_search > aggregated_data[profile_name]['last_search']):
-                        aggregated_data[profile_name]['last_search'] = last_search
-
-            except Exception as e:
-                print(f"Error procesando archivo {report_path}: {e}")
-                continue
-
-        return {
-            'aggregated_data': aggregated_data,
-            'reports_found': len(weekly_reports),
-            'reports_count': len(weekly_reports)
-        }
+        return period_reports
 
-    def _process_monthly_reports(self, start_of_month, end_of_month):
-        """Procesa los reportes diarios del mes y agrega los datos correctamente."""
-        monthly_reports = []
-        pattern = str(self.reports_dir / "reporte_perfiles_*.xlsx")
+    def _aggregate_daily_reports(self, start_date, end_date, optimal_key, period_days):
+        """
+        Agrega los datos de los reportes diarios de un período (semana o mes).
 
-        # Buscar archivos del mes
-        for file_path in glob.glob(pattern):
-            try:
-                file_name = os.path.basename(file_path)
-                date_part = file_name.split('_')[2].split('.')[0][:8]
-                file_date = datetime.strptime(date_part, "%Y%m%d").date()
+        Args:
+            start_date (date): Primer día del período
+            end_date (date): Último día del período
+            optimal_key (str): Clave donde se guarda el objetivo del período
+                ('weekly_optimal' o 'monthly_optimal')
+            period_days (int): Días por los que se multiplica el óptimo diario
 
-                if start_of_month <= file_date <= end_of_month:
-                    monthly_reports.append(file_path)
-            except (ValueError, IndexError):
-                continue
+        Returns:
+            dict: Datos agregados por perfil y cantidad de reportes procesados
+        """
+        period_reports = self._find_daily_reports(start_date, end_date)
 
         # Procesar datos agregados
         aggregated_data = {}
 
-        # Calcular el número de días en el mes
-        days_in_month = (end_of_month - start_of_month).days + 1
-
-        for report_path in monthly_reports:
+        for report_path in period_reports:
             try:
-                wb = openpyxl.load_workbook(report_path, data_only=True)
-                ws = wb.active
+                # Modo de solo lectura: las filas se recorren en secuencia sin cargar
+                # la hoja completa; el archivo se cierra explícitamente al terminar
+                wb = openpyxl.load_workbook(report_path, read_only=True, data_only=True)
+                try:
+                    rows = list(wb.active.iter_rows(min_row=4, values_only=True))
+                finally:
+                    wb.close()
+
+                if not rows:
+                    continue
 
-                header_map = self._get_header_map(ws)
+                header_map = self._get_header_map(rows[0])
                 name_col = header_map.get("nombre del perfil")
                 executions_col = header_map.get("cantidad de ejecuciones")
                 optimal_col = header_map.get("cantidad de ejecuciones recomendadas")
@@ -335,27 +469,27 @@ class ReportService:
                 last_update_col = header_map.get("última actualización")
                 delivery_col = header_map.get("fecha de entrega")
 
-                if not name_col or not executions_col or not optimal_col:
+                if name_col is None or executions_col is None or optimal_col is None:
                     continue
 
-                for row in range(5, ws.max_row + 1):
-                    profile_name = ws.cell(row=row, column=name_col).value
+                for values in rows[1:]:
+                    profile_name = self._row_value(values, name_col)
                     if not profile_name:
                         continue
 
-                    responsable = ws.cell(row=row, column=responsable_col).value if responsable_col else ""
-                    executions = ws.cell(row=row, column=executions_col).value or 0
-                    optimal_cell = ws.cell(row=row, column=optimal_col).value
-                    is_automatic = bool(automatic_col and ws.cell(row=row, column=automatic_col).value == "X")
-                    is_manual = bool(manual_col and ws.cell(row=row, column=manual_col).value == "X")
-                    is_offline = bool(offline_col and ws.cell(row=row, column=offline_col).value == "X")
-                    last_search = ws.cell(row=row, column=last_search_col).value if last_search_col else None
-                    last_update_text = ws.cell(row=row, column=last_update_col).value if last_update_col else ""
-                    delivery_date_text = ws.cell(row=row, column=delivery_col).value if delivery_col else ""
-
-                    if isinstance(last_update_text, str) and last_update_text.strip() == "—":
+                    responsable = self._row_value(values, responsable_col, "")
+                    executions = self._row_value(values, executions_col) or 0
+                    optimal_cell = self._row_value(values, optimal_col)
+                    is_automatic = self._row_value(values, automatic_col) == _BOT_MARK
+                    is_manual = self._row_value(values, manual_col) == _BOT_MARK
+                    is_offline = self._row_value(values, offline_col) == _BOT_MARK
+                    last_search = self._row_value(values, last_search_col)
+                    last_update_text = self._row_value(values, last_update_col, "")
+                    delivery_date_text = self._row_value(values, delivery_col, "")
+
+                    if isinstance(last_update_text, str) and last_update_text.strip() == _EMPTY_TEXT:
                         last_update_text = ""
-                    if isinstance(delivery_date_text, str) and delivery_date_text.strip() == "—":
+                    if isinstance(delivery_date_text, str) and delivery_date_text.strip() == _EMPTY_TEXT:
                         delivery_date_text = ""
 
                     # Procesar ejecuciones óptimas
@@ -366,7 +500,7 @@ class ReportService:
                         aggregated_data[profile_name] = {
                             'executions': 0,
                             'daily_optimal': daily_optimal,
-                            'monthly_optimal': daily_optimal * days_in_month if has_tracking else 0,
+                            optimal_key: daily_optimal * period_days if has_tracking else 0,
                             'has_tracking': has_tracking,
                             'is_automatic': is_automatic,
                             'is_manual': is_manual,
@@ -409,9 +543,8 @@ class ReportService:
 
         return {
             'aggregated_data': aggregated_data,
-            'reports_found': len(monthly_reports),
-            'reports_count': len(monthly_reports),
-            'days_in_month': days_in_month
+            'reports_found': len(period_reports),
+            'reports_count': len(period_reports)
         }
 
     def _extract_optimal_value(self, optimal_cell):
@@ -434,613 +567,410 @@ class ReportService:
 
         return 0
 
-    def _calculate_weekly_success_percentage(self, executions, weekly_optimal):
-        """Calcula el porcentaje de éxito semanal correctamente."""
-        if weekly_optimal <= 0:
+    def _calculate_period_success_percentage(self, executions, period_optimal):
+        """Calcula el porcentaje de éxito de un período contra su objetivo acumulado."""
+        if period_optimal <= 0:
             return None
-        return (executions / weekly_optimal) * 100
-
-    def _calculate_monthly_success_percentage(self, executions, monthly_optimal):
-        """Calcula el porcentaje de éxito mensual correctamente."""
-        if monthly_optimal <= 0:
-            return None
-        return (executions / monthly_optimal) * 100
+        return (executions / period_optimal) * 100
 
     def _get_success_format(self, percentage):
         """Obtiene el formato apropiado basado en el porcentaje de éxito."""
         if percentage is None:
             return "N/A", None, None
 
+        fill_color, font_color = self._get_success_colors(percentage)
         if percentage >= 100.0:
-            return f"✅ {percentage:.1f}%", "FF90EE90", "006400"
-        elif percentage >= 90.0:
-            return f"📊 {percentage:.1f}%", "FFE6E6FA", "800080"
+            icon = "✅"
         elif percentage >= 50.0:
-            return f"📊 {percentage:.1f}%", "FFE6E6FA", "800080"
+            icon = "📊"
         elif percentage >= 30.0:
-            return f"⚠️ {percentage:.1f}%", "FFFFFF99", "B8860B"
+            icon = "⚠️"
         else:
-            return f"❌ {percentage:.1f}%", "FFFFCCCC", "CC0000"
-
-    def _add_weekly_profile_data(self, worksheet, aggregated_data, styles):
-        """Agrega los datos de perfiles al reporte semanal con cálculos corregidos."""
-        row_num = 5
+            icon = "❌"
+        return f"{icon} {percentage:.1f}%", fill_color, font_color
 
-        for profile_name, data in aggregated_data.items():
-            # Nombre del Perfil
-            cell = worksheet.cell(row=row_num, column=1)
-            cell.value = profile_name
-            cell.border = styles['border']
-
-            # Responsable
-            cell = worksheet.cell(row=row_num, column=2)
-            cell.value = data.get('responsable') or "—"
-            cell.border = styles['border']
-
-            # Última Actualización
-            cell = worksheet.cell(row=row_num, column=3)
-            cell.value = data.get('last_update_text') or "—"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Fecha de entrega
-            cell = worksheet.cell(row=row_num, column=4)
-            cell.value = data.get('delivery_date_text') or "—"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Ejecuciones Acumuladas
-            cell = worksheet.cell(row=row_num, column=5)
-            cell.value = data['executions']
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Ejecuciones Óptimas Semanales
-            cell = worksheet.cell(row=row_num, column=6)
-            if data['has_tracking']:
-                cell.value = f"🎯 {data['weekly_optimal']} (7 días)"
-            else:
-                cell.value = "◼ Deshabilitado"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Porcentaje de Éxito Semanal (CORREGIDO)
-            cell = worksheet.cell(row=row_num, column=7)
-            success_percentage = self._calculate_weekly_success_percentage(
-                data['executions'], data['weekly_optimal']
+    def _get_success_colors(self, percentage):
+        """Obtiene los colores de relleno y fuente para un porcentaje de éxito, sin formatear texto."""
+        if percentage >= 100.0:
+            return "FF90EE90", "006400"
+        elif percentage >= 50.0:
+            return "FFE6E6FA", "800080"
+        elif percentage >= 30.0:
+            return "FFFFFF99", "B8860B"
+        else:
+            return "FFFFCCCC", "CC0000"
+
+    def _get_success_styles(self, fill_color, font_color):
+        """Obtiene (y reutiliza) el relleno y la fuente para un formato de éxito."""
+        key = (fill_color, font_color)
+        cached = _SUCCESS_STYLE_CACHE.get(key)
+        if cached is None:
+            cached = (
+                PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid"),
+                Font(bold=True, color=font_color),
             )
+            _SUCCESS_STYLE_CACHE[key] = cached
+        return cached
 
-            success_display, fill_color, font_color = self._get_success_format(success_percentage)
-            cell.value = success_display
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            if fill_color and font_color:
-                cell.fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
-                cell.font = Font(bold=True, color=font_color)
-
-            # Bot Automático
-            cell = worksheet.cell(row=row_num, column=8)
-            if data['is_automatic']:
-                cell.value = "X"
-                cell.fill = styles['bot_fill']
-                cell.font = styles['bot_font']
-            else:
-                cell.value = ""
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Bot Manual
-            cell = worksheet.cell(row=row_num, column=9)
-            if data['is_manual']:
-                cell.value = "X"
-                cell.fill = styles['bot_fill']
-                cell.font = styles['bot_font']
-            else:
-                cell.value = ""
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Bot Offline
-            cell = worksheet.cell(row=row_num, column=10)
-            if data.get('is_offline'):
-                cell.value = "X"
-                cell.fill = styles['bot_fill']
-                cell.font = styles['bot_font']
-            else:
-                cell.value = ""
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Última Búsqueda
-            cell = worksheet.cell(row=row_num, column=11)
-            cell.value = data['last_search'] if data['last_search'] else "Nunca"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            row_num += 1
+    def _add_weekly_profile_data(self, worksheet, aggregated_data, styles):
+        """Agrega los datos de perfiles al reporte semanal con cálculos corregidos."""
+        self._add_aggregated_profile_data(worksheet, aggregated_data, styles, 'weekly_optimal')
 
     def _add_monthly_profile_data(self, worksheet, aggregated_data, styles):
         """Agrega los datos de perfiles al reporte mensual con cálculos corregidos."""
-        row_num = 5
+        self._add_aggregated_profile_data(worksheet, aggregated_data, styles, 'monthly_optimal')
+
+    def _add_aggregated_profile_data(self, worksheet, aggregated_data, styles, optimal_key):
+        """
+        Agrega los datos de perfiles agregados de un período (semana o mes).
 
+        Args:
+            worksheet: Hoja donde se escriben las filas
+            aggregated_data (dict): Datos agregados por perfil
+            styles (dict): Estilos reutilizables del reporte
+            optimal_key (str): Clave del objetivo del período en los datos agregados
+        """
         for profile_name, data in aggregated_data.items():
-            # Nombre del Perfil
-            cell = worksheet.cell(row=row_num, column=1)
-            cell.value = profile_name
-            cell.border = styles['border']
-
-            # Responsable
-            cell = worksheet.cell(row=row_num, column=2)
-            cell.value = data.get('responsable') or "—"
-            cell.border = styles['border']
-
-            # Última Actualización
-            cell = worksheet.cell(row=row_num, column=3)
-            cell.value = data.get('last_update_text') or "—"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Fecha de entrega
-            cell = worksheet.cell(row=row_num, column=4)
-            cell.value = data.get('delivery_date_text') or "—"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Ejecuciones Acumuladas
-            cell = worksheet.cell(row=row_num, column=5)
-            cell.value = data['executions']
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Ejecuciones Óptimas Mensuales
-            cell = worksheet.cell(row=row_num, column=6)
+            period_optimal = data[optimal_key]
+
+            # Ejecuciones Óptimas del período
             if data['has_tracking']:
-                days_count = data['monthly_optimal'] // data['daily_optimal'] if data['daily_optimal'] > 0 else 0
-                cell.value = f"🎯 {data['monthly_optimal']} ({days_count} días)"
+                days_count = period_optimal // data['daily_optimal'] if data['daily_optimal'] > 0 else 0
+                optimal_display = f"🎯 {period_optimal} ({days_count} días)"
             else:
-                cell.value = "◼ Deshabilitado"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Porcentaje de Éxito Mensual
-            cell = worksheet.cell(row=row_num, column=7)
-            success_percentage = self._calculate_monthly_success_percentage(
-                data['executions'], data['monthly_optimal']
-            )
+                optimal_display = "◼ Deshabilitado"
 
+            # Porcentaje de Éxito del período
+            success_percentage = self._calculate_period_success_percentage(
+                data['executions'], period_optimal
+            )
             success_display, fill_color, font_color = self._get_success_format(success_percentage)
-            cell.value = success_display
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
+            success_fill = success_font = None
             if fill_color and font_color:
-                cell.fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
-                cell.font = Font(bold=True, color=font_color)
-
-            # Bot Automático
-            cell = worksheet.cell(row=row_num, column=8)
-            if data['is_automatic']:
-                cell.value = "X"
-                cell.fill = styles['bot_fill']
-                cell.font = styles['bot_font']
-            else:
-                cell.value = ""
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Bot Manual
-            cell = worksheet.cell(row=row_num, column=9)
-            if data['is_manual']:
-                cell.value = "X"
-                cell.fill = styles['bot_fill']
-                cell.font = styles['bot_font']
-            else:
-                cell.value = ""
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Bot Offline
-            cell = worksheet.cell(row=row_num, column=10)
-            if data.get('is_offline'):
-                cell.value = "X"
-                cell.fill = styles['bot_fill']
-                cell.font = styles['bot_font']
-            else:
-                cell.value = ""
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Última Búsqueda
-            cell = worksheet.cell(row=row_num, column=11)
-            cell.value = data['last_search'] if data['last_search'] else "Nunca"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            row_num += 1
+                success_fill, success_font = self._get_success_styles(fill_color, font_color)
+
+            worksheet.append([
+                self._data_cell(worksheet, profile_name, _DATA_STYLE),
+                self._data_cell(worksheet, data.get('responsable') or _EMPTY_TEXT, _DATA_STYLE),
+                self._data_cell(worksheet, data.get('last_update_text') or _EMPTY_TEXT),
+                self._data_cell(worksheet, data.get('delivery_date_text') or _EMPTY_TEXT),
+                self._data_cell(worksheet, data['executions']),
+                self._data_cell(worksheet, optimal_display),
+                self._data_cell(worksheet, success_display, fill=success_fill, font=success_font),
+                self._bot_cell(worksheet, data['is_automatic'], styles),
+                self._bot_cell(worksheet, data['is_manual'], styles),
+                self._bot_cell(worksheet, data.get('is_offline'), styles),
+                self._data_cell(worksheet, data['last_search'] if data['last_search'] else _NEVER_TEXT),
+            ])
+
+    def _register_named_styles(self, workbook, styles):
+        """
+        Registra en el libro los estilos con nombre usados por las celdas.
 
-    def _get_report_styles(self):
-        """Define los estilos reutilizables para los reportes."""
-        return {
-            'title_font': Font(bold=True, size=16, color="FFFFFF"),
-            'title_fill': PatternFill(start_color="FF2E5090", end_color="FF2E5090", fill_type="solid"),
-            'title_alignment': Alignment(horizontal="center", vertical="center"),
-            'subtitle_font': Font(bold=True, size=12, color="000000"),
-            'subtitle_alignment': Alignment(horizontal="center", vertical="center"),
-            'header_font': Font(bold=True, color="FFFFFF"),
-            'header_fill': PatternFill(start_color="FF366092", end_color="FF366092", fill_type="solid"),
-            'header_alignment': Alignment(horizontal="center", vertical="center"),
-            'bot_fill': PatternFill(start_color="FFFFC0CB", end_color="FFFFC0CB", fill_type="solid"),
-            'bot_font': Font(bold=True, color="C71585"),
-            'border': Border(
-                top=Side(border_style="thin", color="000000"),
-                bottom=Side(border_style="thin", color="000000"),
-                left=Side(border_style="thin", color="000000"),
-                right=Side(border_style="thin", color="000000")
+        Cada celda recibe su formato completo con una sola asignación de estilo en
+        lugar de asignar fuente, relleno, alineación y borde por separado.
+        """
+        workbook.add_named_style(NamedStyle(name=_DATA_STYLE, font=DEFAULT_FONT, border=_THIN_BORDER))
+        workbook.add_named_style(
+            NamedStyle(
+                name=_DATA_CENTER_STYLE,
+                font=DEFAULT_FONT,
+                alignment=_CENTER_ALIGNMENT,
+                border=_THIN_BORDER
             )
-        }
+        )
+        workbook.add_named_style(
+            NamedStyle(
+                name=_TITLE_STYLE,
+                font=styles['title_font'],
+                fill=styles['title_fill'],
+                alignment=styles['title_alignment'],
+                border=styles['border']
+            )
+        )
+        workbook.add_named_style(
+            NamedStyle(
+                name=_SUBTITLE_STYLE,
+                font=styles['subtitle_font'],
+                alignment=styles['subtitle_alignment'],
+                border=styles['border']
+            )
+        )
+        workbook.add_named_style(
+            NamedStyle(
+                name=_HEADER_STYLE,
+                font=styles['header_font'],
+                fill=styles['header_fill'],
+                alignment=styles['header_alignment'],
+                border=styles['border']
+            )
+        )
+        workbook.add_named_style(NamedStyle(name=_BORDER_STYLE, font=DEFAULT_FONT, border=styles['border']))
 
-    def _add_daily_header(self, worksheet, total_bots, styles):
+    def _add_daily_header(self, worksheet, total_bots, styles, current_date):
         """Agrega el encabezado para reportes diarios."""
-        worksheet.merge_cells('A1:K1')
-        title_cell = worksheet['A1']
-        title_cell.value = "Reporte de Ejecuciones - Registro Diario"
-        title_cell.font = styles['title_font']
-        title_cell.fill = styles['title_fill']
-        title_cell.alignment = styles['title_alignment']
-        title_cell.border = styles['border']
-
-        for col in range(1, 12):
-            worksheet.cell(row=1, column=col).border = styles['border']
-
-        worksheet.merge_cells('A2:K2')
-        subtitle_cell = worksheet['A2']
-        current_date = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        subtitle_cell.value = f"Generado el {current_date} - Total de Bots: {total_bots}"
-        subtitle_cell.font = styles['subtitle_font']
-        subtitle_cell.alignment = styles['subtitle_alignment']
-
-        for col in range(1, 12):
-            worksheet.cell(row=2, column=col).border = styles['border']
-
-        worksheet.row_dimensions[3].height = 10
-
-    def _add_weekly_header(self, worksheet, start_date, end_date, total_bots, styles):
+        self._append_header_rows(
+            worksheet,
+            "Reporte de Ejecuciones - Registro Diario",
+            f"Generado el {current_date} - Total de Bots: {total_bots}",
+            styles
+        )
+
+    def _add_weekly_header(self, worksheet, start_date, end_date, total_bots, styles, current_date):
         """Agrega el encabezado para reportes semanales."""
         week_number = start_date.isocalendar()[1]
-
-        worksheet.merge_cells('A1:K1')
-        title_cell = worksheet['A1']
-        title_cell.value = f"Reporte de Ejecuciones - Resumen Semanal (Semana {week_number})"
-        title_cell.font = styles['title_font']
-        title_cell.fill = styles['title_fill']
-        title_cell.alignment = styles['title_alignment']
-        title_cell.border = styles['border']
-
-        for col in range(1, 12):
-            worksheet.cell(row=1, column=col).border = styles['border']
-
-        worksheet.merge_cells('A2:K2')
-        subtitle_cell = worksheet['A2']
-        current_date = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        period_text = f"{start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')}"
-        subtitle_cell.value = f"Generado el {current_date} - Período: {period_text}"
-        subtitle_cell.font = styles['subtitle_font']
-        subtitle_cell.alignment = styles['subtitle_alignment']
-
-        for col in range(1, 12):
-            worksheet.cell(row=2, column=col).border = styles['border']
-
-        worksheet.row_dimensions[3].height = 10
-
-    def _add_monthly_header(self, worksheet, start_date, end_date, total_bots, styles):
+        period_text = f"{start_date.strftime(_DATE_FORMAT)} - {end_date.strftime(_DATE_FORMAT)}"
+        self._append_header_rows(
+            worksheet,
+            f"Reporte de Ejecuciones - Resumen Semanal (Semana {week_number})",
+            f"Generado el {current_date} - Período: {period_text}",
+            styles
+        )
+
+    def _add_monthly_header(self, worksheet, start_date, end_date, total_bots, styles, current_date):
         """Agrega el encabezado para reportes mensuales."""
         month_name = start_date.strftime("%B").capitalize()
         year = start_date.year
+        period_text = f"{start_date.strftime(_DATE_FORMAT)} - {end_date.strftime(_DATE_FORMAT)}"
+        self._append_header_rows(
+            worksheet,
+            f"Reporte de Ejecuciones - Resumen Mensual ({month_name} {year})",
+            f"Generado el {current_date} - Período: {period_text}",
+            styles
+        )
+
+    def _append_header_rows(self, worksheet, title, subtitle, styles):
+        """
+        Agrega las filas combinadas de título y subtítulo más la fila separadora.
 
-        worksheet.merge_cells('A1:K1')
-        title_cell = worksheet['A1']
-        title_cell.value = f"Reporte de Ejecuciones - Resumen Mensual ({month_name} {year})"
-        title_cell.font = styles['title_font']
-        title_cell.fill = styles['title_fill']
-        title_cell.alignment = styles['title_alignment']
-        title_cell.border = styles['border']
-
-        for col in range(1, 12):
-            worksheet.cell(row=1, column=col).border = styles['border']
-
-        worksheet.merge_cells('A2:K2')
-        subtitle_cell = worksheet['A2']
-        current_date = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        period_text = f"{start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')}"
-        subtitle_cell.value = f"Generado el {current_date} - Período: {period_text}"
-        subtitle_cell.font = styles['subtitle_font']
-        subtitle_cell.alignment = styles['subtitle_alignment']
-
-        for col in range(1, 12):
-            worksheet.cell(row=2, column=col).border = styles['border']
+        Las filas se escriben con append para que funcione tanto en hojas normales
+        como en hojas de solo escritura.
+        """
+        for text, style in ((title, _TITLE_STYLE), (subtitle, _SUBTITLE_STYLE)):
+            row = [self._data_cell(worksheet, text, style)]
+            for _ in range(2, 12):
+                row.append(self._data_cell(worksheet, None, _BORDER_STYLE))
+            worksheet.append(row)
 
         worksheet.row_dimensions[3].height = 10
+        worksheet.append([])
+
+        worksheet.merged_cells.add('A1:K1')
+        worksheet.merged_cells.add('A2:K2')
 
     def _add_table_headers(self, worksheet, styles):
         """Agrega los encabezados de la tabla."""
-        headers = [
-            "Nombre del Perfil",
-            "Responsable",
-            "Última Actualización",
-            "Fecha de entrega",
-            "Cantidad de ejecuciones",
-            "Cantidad de Ejecuciones recomendadas",
-            "Porcentaje de Éxito",
-            "Bot Automático",
-            "Bot Manual",
-            "Bot Offline",
-            "Última Búsqueda"
-        ]
+        worksheet.append([self._data_cell(worksheet, header, _HEADER_STYLE) for header in _TABLE_HEADERS])
+
+    def _data_cell(self, worksheet, value, style=_DATA_CENTER_STYLE, fill=None, font=None):
+        """Crea una celda de datos con su estilo con nombre y relleno/fuente opcionales."""
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.style = style
+        if fill is not None:
+            cell.fill = fill
+            cell.font = font
+        return cell
+
+    def _bot_cell(self, worksheet, is_marked, styles):
+        """Crea la celda de una columna de tipo de bot."""
+        if is_marked:
+            return self._data_cell(worksheet, _BOT_MARK, fill=styles['bot_fill'], font=styles['bot_font'])
+        return self._data_cell(worksheet, "")
+
+    def _build_daily_rows(self, profiles):
+        """
+        Prepara los valores de cada fila del reporte diario sin tocar la hoja.
 
-        for col_num, header in enumerate(headers, 1):
-            cell = worksheet.cell(row=4, column=col_num)
-            cell.value = header
-            cell.font = styles['header_font']
-            cell.fill = styles['header_fill']
-            cell.alignment = styles['header_alignment']
-            cell.border = styles['border']
-
-    def _add_profile_data(self, worksheet, profiles, styles):
-        """Agrega los datos de perfiles para reporte diario."""
-        for row_num, profile in enumerate(profiles, 5):
-            # Nombre del Perfil
-            cell = worksheet.cell(row=row_num, column=1)
-            cell.value = profile.name
-            cell.border = styles['border']
-
-            # Responsable
-            cell = worksheet.cell(row=row_num, column=2)
-            cell.value = profile.responsable if getattr(profile, "responsable", "") else "—"
-            cell.border = styles['border']
-
-            # Última Actualización (texto manual)
-            cell = worksheet.cell(row=row_num, column=3)
-            cell.value = profile.get_last_update_display() if hasattr(profile, "get_last_update_display") else "—"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Fecha de entrega (texto manual)
-            cell = worksheet.cell(row=row_num, column=4)
-            cell.value = profile.get_delivery_date_display() if hasattr(profile, "get_delivery_date_display") else "—"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Cantidad de ejecuciones
-            cell = worksheet.cell(row=row_num, column=5)
-            cell.value = profile.found_emails
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Ejecuciones Óptimas
-            cell = worksheet.cell(row=row_num, column=6)
-            cell.value = profile.get_optimal_display()
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Porcentaje de Éxito
-            cell = worksheet.cell(row=row_num, column=7)
-            success_display = profile.get_success_display()
-            success_percentage = profile.get_success_percentage()
-
-            cell.value = success_display
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Aplicar formato condicional
-            if success_percentage is not None:
-                _, fill_color, font_color = self._get_success_format(success_percentage)
-                if fill_color and font_color:
-                    cell.fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
-                    cell.font = Font(bold=True, color=font_color)
-
-            # Bot Automático
-            cell = worksheet.cell(row=row_num, column=8)
-            if profile.is_bot_automatic():
-                cell.value = "X"
-                cell.fill = styles['bot_fill']
-                cell.font = styles['bot_font']
-            else:
-                cell.value = ""
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Bot Manual
-            cell = worksheet.cell(row=row_num, column=9)
-            if profile.is_bot_manual():
-                cell.value = "X"
-                cell.fill = styles['bot_fill']
-                cell.font = styles['bot_font']
-            else:
-                cell.value = ""
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
-
-            # Bot Offline
-            cell = worksheet.cell(row=row_num, column=10)
-            if hasattr(profile, "is_bot_offline") and profile.is_bot_offline():
-                cell.value = "X"
-                cell.fill = styles['bot_fill']
-                cell.font = styles['bot_font']
-            else:
-                cell.value = ""
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
+        Los mismos valores sirven para la clave de caché y para escribir las celdas,
+        de modo que los métodos de visualización de cada perfil se llaman una sola vez.
+
+        Args:
+            profiles (list): Lista de perfiles de búsqueda
 
-            # Última Búsqueda
-            cell = worksheet.cell(row=row_num, column=11)
+        Returns:
+            list: Una tupla de valores por perfil
+        """
+        rows = []
+        for profile in profiles:
             if profile.last_search:
-                cell.value = profile.last_search.strftime("%d/%m/%Y %H:%M:%S")
+                last_search = profile.last_search.strftime(_DATETIME_FORMAT)
             else:
-                cell.value = "Nunca"
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = styles['border']
+                last_search = _NEVER_TEXT
+
+            rows.append((
+                profile.name,
+                profile.responsable if getattr(profile, "responsable", "") else _EMPTY_TEXT,
+                profile.get_last_update_display() if hasattr(profile, "get_last_update_display") else _EMPTY_TEXT,
+                profile.get_delivery_date_display() if hasattr(profile, "get_delivery_date_display") else _EMPTY_TEXT,
+                profile.found_emails,
+                profile.get_optimal_display(),
+                profile.get_success_display(),
+                profile.get_success_percentage(),
+                profile.is_bot_automatic(),
+                profile.is_bot_manual(),
+                hasattr(profile, "is_bot_offline") and profile.is_bot_offline(),
+                last_search,
+            ))
+        return rows
+
+    def _add_profile_data(self, worksheet, rows, styles):
+        """Agrega los datos de perfiles para reporte diario, una fila por perfil."""
+        for (name, responsable, last_update, delivery_date, found_emails, optimal_display,
+             success_display, success_percentage, is_automatic, is_manual, is_offline,
+             last_search) in rows:
+            # Porcentaje de Éxito con formato condicional
+            # El texto ya viene del perfil: solo se necesitan los colores
+            success_fill = success_font = None
+            if success_percentage is not None:
+                success_fill, success_font = self._get_success_styles(
+                    *self._get_success_colors(success_percentage)
+                )
+
+            worksheet.append([
+                self._data_cell(worksheet, name, _DATA_STYLE),
+                self._data_cell(worksheet, responsable, _DATA_STYLE),
+                self._data_cell(worksheet, last_update),
+                self._data_cell(worksheet, delivery_date),
+                self._data_cell(worksheet, found_emails),
+                self._data_cell(worksheet, optimal_display),
+                self._data_cell(worksheet, success_display, fill=success_fill, font=success_font),
+                self._bot_cell(worksheet, is_automatic, styles),
+                self._bot_cell(worksheet, is_manual, styles),
+                self._bot_cell(worksheet, is_offline, styles),
+                self._data_cell(worksheet, last_search),
+            ])
 
     def _format_daily_worksheet(self, worksheet):
         """Aplica formato general a la hoja de trabajo."""
-        column_widths = {
-            1: 30,
-            2: 22,
-            3: 24,
-            4: 22,
-            5: 20,
-            6: 35,
-            7: 18,
-            8: 15,
-            9: 12,
-            10: 12,
-            11: 22
-        }
-
-        for col_num, width in column_widths.items():
-            worksheet.column_dimensions[get_column_letter(col_num)].width = width
+        for letter, width in (
+            ("A", 30), ("B", 22), ("C", 24), ("D", 22), ("E", 20), ("F", 35),
+            ("G", 18), ("H", 15), ("I", 12), ("J", 12), ("K", 22)
+        ):
+            worksheet.column_dimensions[letter].width = width
 
         worksheet.row_dimensions[1].height = 25
         worksheet.row_dimensions[2].height = 20
 
-    def _create_weekly_file(self, start_date, end_date):
+    def _create_weekly_file(self, start_date, end_date, generated_at):
         """Crea el nombre y ruta del archivo de reporte semanal."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
         week_number = start_date.isocalendar()[1]
         filename = f"reporte_semanal_{timestamp}_semana{week_number}.xlsx"
         return self.reports_dir / filename
 
-    def _create_monthly_file(self, start_date, end_date):
+    def _create_monthly_file(self, start_date, end_date, generated_at):
         """Crea el nombre y ruta del archivo de reporte mensual."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
         month_name = start_date.strftime("%B").lower()
         year = start_date.year
         filename = f"reporte_mensual_{timestamp}_{month_name}{year}.xlsx"
         return self.reports_dir / filename
 
-    def _add_summary_sheet(self, worksheet, profiles):
-        """Agrega hoja de resumen para reporte diario."""
-        worksheet.cell(row=1, column=1).value = "RESUMEN EJECUTIVO - DIARIO"
-        worksheet.cell(row=1, column=1).font = Font(bold=True, size=16, color="366092")
-        worksheet.merge_cells('A1:B1')
-
-        current_date = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        worksheet.cell(row=3, column=1).value = "Fecha de generación:"
-        worksheet.cell(row=3, column=1).font = Font(bold=True)
-        worksheet.cell(row=3, column=2).value = current_date
-
-        worksheet.cell(row=4, column=1).value = "Total de bots:"
-        worksheet.cell(row=4, column=1).font = Font(bold=True)
-        worksheet.cell(row=4, column=2).value = len(profiles)
-
-        # Agregar más métricas del resumen...
-        worksheet.column_dimensions['A'].width = 40
-        worksheet.column_dimensions['B'].width = 30
-
-    def _add_weekly_summary_sheet(self, worksheet, weekly_data, start_date, end_date):
-        """Agrega hoja de resumen semanal con métricas corregidas."""
-        worksheet.cell(row=1, column=1).value = "RESUMEN EJECUTIVO - SEMANAL"
-        worksheet.cell(row=1, column=1).font = Font(bold=True, size=16, color="366092")
-        worksheet.merge_cells('A1:B1')
-
-        current_date = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        worksheet.cell(row=3, column=1).value = "Fecha de generación:"
-        worksheet.cell(row=3, column=1).font = Font(bold=True)
-        worksheet.cell(row=3, column=2).value = current_date
-
-        period_text = f"{start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')}"
-        worksheet.cell(row=4, column=1).value = "Período del reporte:"
-        worksheet.cell(row=4, column=1).font = Font(bold=True)
-        worksheet.cell(row=4, column=2).value = period_text
-
-        worksheet.cell(row=5, column=1).value = "Reportes diarios incluidos:"
-        worksheet.cell(row=5, column=1).font = Font(bold=True)
-        worksheet.cell(row=5, column=2).value = weekly_data['reports_count']
-
-        # Agregar métricas de éxito semanal corregidas
-        profiles_with_tracking = [
-            data for data in weekly_data['aggregated_data'].values()
-            if data['has_tracking']
-        ]
-
-        worksheet.cell(row=7, column=1).value = "MÉTRICAS DE ÉXITO SEMANAL (CORREGIDAS)"
-        worksheet.cell(row=7, column=1).font = Font(bold=True, size=14, color="006400")
-
-        worksheet.cell(row=8, column=1).value = "Perfiles con seguimiento:"
-        worksheet.cell(row=8, column=1).font = Font(bold=True)
-        worksheet.cell(row=8, column=2).value = len(profiles_with_tracking)
+    def _write_summary_rows(self, worksheet, rows):
+        """
+        Escribe una hoja de resumen a partir de una tabla declarativa.
 
+        Args:
+            worksheet: Hoja donde se escriben las filas
+            rows (list): Tuplas (etiqueta, valor, estilo); None representa una fila en blanco
+        """
+        fonts = _SUMMARY_FONTS
         worksheet.column_dimensions['A'].width = 40
         worksheet.column_dimensions['B'].width = 30
 
-    def _add_monthly_summary_sheet(self, worksheet, monthly_data, start_date, end_date):
-        """Agrega hoja de resumen mensual con métricas corregidas."""
-        worksheet.cell(row=1, column=1).value = "RESUMEN EJECUTIVO - MENSUAL"
-        worksheet.cell(row=1, column=1).font = Font(bold=True, size=16, color="366092")
-        worksheet.merge_cells('A1:B1')
-
-        current_date = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        worksheet.cell(row=3, column=1).value = "Fecha de generación:"
-        worksheet.cell(row=3, column=1).font = Font(bold=True)
-        worksheet.cell(row=3, column=2).value = current_date
-
-        month_name = start_date.strftime("%B").capitalize()
-        year = start_date.year
-        period_text = f"{start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')}"
-
-        worksheet.cell(row=4, column=1).value = "Mes:"
-        worksheet.cell(row=4, column=1).font = Font(bold=True)
-        worksheet.cell(row=4, column=2).value = f"{month_name} {year}"
+        for row in rows:
+            if row is None:
+                worksheet.append([])
+                continue
 
-        worksheet.cell(row=5, column=1).value = "Período completo:"
-        worksheet.cell(row=5, column=1).font = Font(bold=True)
-        worksheet.cell(row=5, column=2).value = period_text
+            label, value, style_key = row
+            label_cell = WriteOnlyCell(worksheet, value=label)
+            label_cell.font = fonts[style_key]
+            worksheet.append([label_cell, value])
 
-        worksheet.cell(row=6, column=1).value = "Días en el mes:"
-        worksheet.cell(row=6, column=1).font = Font(bold=True)
-        worksheet.cell(row=6, column=2).value = monthly_data['days_in_month']
+        worksheet.merged_cells.add('A1:B1')
 
-        worksheet.cell(row=7, column=1).value = "Reportes diarios incluidos:"
-        worksheet.cell(row=7, column=1).font = Font(bold=True)
-        worksheet.cell(row=7, column=2).value = monthly_data['reports_count']
+    def _add_summary_sheet(self, worksheet, profiles, current_date):
+        """Agrega hoja de resumen para reporte diario."""
 
-        # Agregar métricas de éxito mensual
-        profiles_with_tracking = [
-            data for data in monthly_data['aggregated_data'].values()
-            if data['has_tracking']
+        rows = [
+            ("RESUMEN EJECUTIVO - DIARIO", None, 'title'),
+            None,
+            ("Fecha de generación:", current_date, 'label'),
+            ("Total de bots:", len(profiles), 'label'),
         ]
 
-        # Calcular métricas acumuladas mensuales
-        total_executions = sum(data['executions'] for data in monthly_data['aggregated_data'].values())
-        optimal_profiles = sum(1 for data in profiles_with_tracking
-                               if self._calculate_monthly_success_percentage(data['executions'],
-                                                                             data['monthly_optimal']) >= 100)
+        self._write_summary_rows(worksheet, rows)
 
-        worksheet.cell(row=9, column=1).value = "MÉTRICAS DE ÉXITO MENSUAL"
-        worksheet.cell(row=9, column=1).font = Font(bold=True, size=14, color="006400")
-
-        worksheet.cell(row=10, column=1).value = "Perfiles con seguimiento:"
-        worksheet.cell(row=10, column=1).font = Font(bold=True)
-        worksheet.cell(row=10, column=2).value = len(profiles_with_tracking)
+    def _add_weekly_summary_sheet(self, worksheet, weekly_data, start_date, end_date, current_date):
+        """Agrega hoja de resumen semanal con métricas corregidas."""
+        period_text = f"{start_date.strftime(_DATE_FORMAT)} - {end_date.strftime(_DATE_FORMAT)}"
+
+        # Contar perfiles con seguimiento sin construir una lista intermedia
+        tracked_profiles = sum(
+            1 for data in weekly_data['aggregated_data'].values() if data['has_tracking']
+        )
+
+        rows = [
+            ("RESUMEN EJECUTIVO - SEMANAL", None, 'title'),
+            None,
+            ("Fecha de generación:", current_date, 'label'),
+            ("Período del reporte:", period_text, 'label'),
+            ("Reportes diarios incluidos:", weekly_data['reports_count'], 'label'),
+            None,
+            ("MÉTRICAS DE ÉXITO SEMANAL (CORREGIDAS)", None, 'section'),
+            ("Perfiles con seguimiento:", tracked_profiles, 'label'),
+        ]
 
-        worksheet.cell(row=11, column=1).value = "Perfiles que alcanzaron objetivo mensual:"
-        worksheet.cell(row=11, column=1).font = Font(bold=True)
-        worksheet.cell(row=11, column=2).value = optimal_profiles
+        self._write_summary_rows(worksheet, rows)
 
-        worksheet.cell(row=12, column=1).value = "Total de ejecuciones en el mes:"
-        worksheet.cell(row=12, column=1).font = Font(bold=True)
-        worksheet.cell(row=12, column=2).value = total_executions
+    def _add_monthly_summary_sheet(self, worksheet, monthly_data, start_date, end_date, current_date):
+        """Agrega hoja de resumen mensual con métricas corregidas."""
+        month_name = start_date.strftime("%B").capitalize()
+        year = start_date.year
+        period_text = f"{start_date.strftime(_DATE_FORMAT)} - {end_date.strftime(_DATE_FORMAT)}"
+
+        # Calcular métricas de éxito mensual en una sola pasada
+        tracked_profiles = 0
+        optimal_profiles = 0
+        total_executions = 0
+        for data in monthly_data['aggregated_data'].values():
+            total_executions += data['executions']
+            if data['has_tracking']:
+                tracked_profiles += 1
+                percentage = self._calculate_period_success_percentage(
+                    data['executions'], data['monthly_optimal']
+                )
+                if percentage >= 100:
+                    optimal_profiles += 1
+
+        rows = [
+            ("RESUMEN EJECUTIVO - MENSUAL", None, 'title'),
+            None,
+            ("Fecha de generación:", current_date, 'label'),
+            ("Mes:", f"{month_name} {year}", 'label'),
+            ("Período completo:", period_text, 'label'),
+            ("Días en el mes:", monthly_data['days_in_month'], 'label'),
+            ("Reportes diarios incluidos:", monthly_data['reports_count'], 'label'),
+            None,
+            ("MÉTRICAS DE ÉXITO MENSUAL", None, 'section'),
+            ("Perfiles con seguimiento:", tracked_profiles, 'label'),
+            ("Perfiles que alcanzaron objetivo mensual:", optimal_profiles, 'label'),
+            ("Total de ejecuciones en el mes:", total_executions, 'label'),
+        ]
 
         # Calcular tasa de éxito general
-        if profiles_with_tracking:
-            success_rate = (optimal_profiles / len(profiles_with_tracking)) * 100
-            worksheet.cell(row=13, column=1).value = "Tasa de éxito general:"
-            worksheet.cell(row=13, column=1).font = Font(bold=True)
-            worksheet.cell(row=13, column=2).value = f"{success_rate:.1f}%"
+        if tracked_profiles:
+            success_rate = (optimal_profiles / tracked_profiles) * 100
+            rows.append(("Tasa de éxito general:", f"{success_rate:.1f}%", 'label'))
 
-        worksheet.column_dimensions['A'].width = 40
-        worksheet.column_dimensions['B'].width = 30
+        self._write_summary_rows(worksheet, rows)
+
+    @cached_property
+    def reports_directory(self):
+        """Ruta del directorio de reportes como texto, calculada una sola vez."""
+        return str(self.reports_dir)
 
     def get_reports_directory(self):
         """Retorna el directorio donde se guardan los reportes."""
-        return str(self.reports_dir)
\ No newline at end of file
+        return self.reports_directory
\ No newline at end of file
@@ -11,10 +11,67 @@ from __future__ import annotations
 
 import calendar
 import json
+import re
 import threading
+from collections import deque
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, Iterable, Optional
+from time import monotonic
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Mapping, NamedTuple, Optional, Union
+
+
+# Máximo de mensajes pendientes de entregar a log_callback
+_LOG_BUFFER_SIZE = 256
+
+# Margen tras la hora programada dentro del cual todavía se ejecuta una tarea
+_RUN_TOLERANCE = timedelta(minutes=5)
+
+# Plazo de espera cuando ninguna frecuencia tiene una próxima ejecución
+_NO_DEADLINE = float("inf")
+
+# Hora "H[:M[:...]]" con espacios opcionales; los valores fuera de rango se acotan
+_TIME_PATTERN = re.compile(r"\s*([+-]?\d+)\s*(?::\s*([+-]?\d+)\s*(?::.*)?)?", re.DOTALL)
+
+
+@lru_cache(maxsize=64)
+def _scheduled_datetime(target_date: date, hour_minute: tuple[int, int]) -> datetime:
+    """Retorna (y reutiliza) la fecha y hora programada para un día.
+
+    La revisión de tareas pendientes y el cálculo de próximas ejecuciones
+    piden los mismos instantes en cada ciclo; al ser inmutables se comparten.
+    """
+
+    hour, minute = hour_minute
+    return datetime(target_date.year, target_date.month, target_date.day, hour, minute)
+
+
+@lru_cache(maxsize=256)
+def _days_in_month(year: int, month: int) -> int:
+    """Retorna (y reutiliza) la cantidad de días de un mes."""
+
+    return calendar.monthrange(year, month)[1]
+
+
+class _FrequencyTimes(NamedTuple):
+    """Un instante opcional por frecuencia, en el orden de ``FREQUENCIES``."""
+
+    daily: Optional[datetime] = None
+    weekly: Optional[datetime] = None
+    monthly: Optional[datetime] = None
+
+
+class _SchedulerState(NamedTuple):
+    """Instantánea inmutable del estado que consulta ``get_status``.
+
+    Nunca se modifica en sitio: el programador publica una nueva instancia
+    con una sola asignación, así los lectores no necesitan candados.
+    """
+
+    config: Dict[str, Dict]
+    next_executions: _FrequencyTimes
+    last_executions: _FrequencyTimes
 
 
 class UnifiedSchedulerService:
@@ -28,7 +85,7 @@ class UnifiedSchedulerService:
     hilo se despierta unos minutos tarde.
     """
 
-    DAY_ORDER = [
+    DAY_ORDER = (
         "monday",
         "tuesday",
         "wednesday",
@@ -36,10 +93,35 @@ class UnifiedSchedulerService:
         "friday",
         "saturday",
         "sunday",
-    ]
+    )
+
+    # Índice de cada día (0 = lunes) para validar y convertir sin búsquedas lineales
+    _DAY_INDEX = {day: index for index, day in enumerate(DAY_ORDER)}
 
     FREQUENCIES = ("daily", "weekly", "monthly")
 
+    # Atributos fijos: sin __dict__ por instancia y acceso con desplazamiento fijo
+    __slots__ = (
+        "config_file",
+        "callbacks",
+        "log_callback",
+        "_log_buf",
+        "_condition",
+        "_stop_requested",
+        "_dirty",
+        "_next_deadline_mono",
+        "thread",
+        "_in_flight",
+        "_state",
+        "_state_lock",
+        "_status_cache",
+        "_next_basis",
+        "_cached_config",
+        "_config_blob",
+        "_last_period_keys",
+        "is_running",
+    )
+
     def __init__(
         self,
         config_file: Path,
@@ -51,19 +133,44 @@ class UnifiedSchedulerService:
         self.config_file = Path(config_file)
         self.callbacks = callbacks or {}
         self.log_callback = log_callback
-
-        self.stop_event = threading.Event()
+        # Mensajes emitidos por el hilo del programador; el buffer se vacía una
+        # vez al final de cada revisión (y antes de cada callback), entregando
+        # cada mensaje por separado. Acotado: si se llena se descartan los más viejos
+        self._log_buf: deque[str] = deque(maxlen=_LOG_BUFFER_SIZE)
+
+        # Condición sobre la que duerme el hilo: se notifica al detener el
+        # servicio o cuando la configuración cambia y hay que reprogramar
+        self._condition = threading.Condition()
+        self._stop_requested = False
+        self._dirty = False
+        # Plazo (reloj monotónico) hasta el que duerme el hilo entre revisiones
+        self._next_deadline_mono = 0.0
         self.thread: Optional[threading.Thread] = None
-        self.lock = threading.Lock()
-
-        self.current_config: Dict[str, Dict] = {}
-        self.next_executions: Dict[str, Optional[datetime]] = {
-            freq: None for freq in self.FREQUENCIES
-        }
-        self.last_execution_times: Dict[str, Optional[datetime]] = {
-            freq: None for freq in self.FREQUENCIES
+        # Marca de "en curso" por frecuencia. Se toma sin bloquear
+        # (acquire(blocking=False) es una prueba y marca atómica), así que
+        # nadie espera nunca por ella
+        self._in_flight: Dict[str, threading.Lock] = {
+            freq: threading.Lock() for freq in self.FREQUENCIES
         }
 
+        self._state = _SchedulerState({}, _FrequencyTimes(), _FrequencyTimes())
+        # Solo serializa a los escritores del estado; los lectores no lo usan
+        self._state_lock = threading.Lock()
+        # Detalle por frecuencia de get_status junto a la instantánea de la
+        # que se generó; cualquier cambio publica otra instantánea y lo invalida
+        self._status_cache: Optional[tuple[_SchedulerState, Mapping[str, Mapping]]] = None
+        # Últimas próximas ejecuciones calculadas, con la configuración y el
+        # instante a partir de los cuales se obtuvieron
+        self._next_basis: Optional[
+            tuple[Dict[str, Dict], datetime, _FrequencyTimes]
+        ] = None
+        # Última configuración normalizada, junto al contenido del archivo del
+        # que se obtuvo
+        self._cached_config: Optional[Dict[str, Dict]] = None
+        self._config_blob: Optional[bytes] = None
+        # Periodo (día, semana o mes) de la última ejecución como entero comparable
+        self._last_period_keys: Dict[str, int] = {}
+
         self.is_running = False
 
         # Asegurar que el directorio exista para evitar errores al leer/escribir
@@ -71,15 +178,37 @@ class UnifiedSchedulerService:
 
         self._setup_scheduler()
 
+    # ------------------------------------------------------------------
+    # Estado publicado
+    # ------------------------------------------------------------------
+    @property
+    def current_config(self) -> Dict[str, Dict]:
+        return self._state.config
+
+    @property
+    def next_executions(self) -> Dict[str, Optional[datetime]]:
+        return self._state.next_executions._asdict()
+
+    @property
+    def last_execution_times(self) -> Dict[str, Optional[datetime]]:
+        return self._state.last_executions._asdict()
+
+    def _publish_state(self, **changes) -> None:
+        """Reemplaza la instantánea del estado con los campos indicados."""
+
+        with self._state_lock:
+            self._state = self._state._replace(**changes)
+
     # ------------------------------------------------------------------
     # Configuración y carga de datos
     # ------------------------------------------------------------------
     def _setup_scheduler(self) -> None:
         """Carga configuración inicial y arranca el hilo si corresponde."""
 
-        self.current_config = self._load_config()
+        config = self._load_config()
+        self._publish_state(config=config)
 
-        if self._any_frequency_enabled(self.current_config):
+        if self._any_frequency_enabled(config):
             self._start_thread()
         else:
             self._log(
@@ -87,60 +216,57 @@ class UnifiedSchedulerService:
             )
 
     def _load_config(self) -> Dict[str, Dict]:
-        """Carga y normaliza la configuración de programación."""
+        """Carga y normaliza la configuración de programación.
 
-        raw_config = self._read_config_file()
-        normalized = self._normalize_config(raw_config)
-        return normalized
+        Solo se llama al iniciar y en ``restart()``. Si el contenido del
+        archivo es idéntico al de la última lectura se reutiliza la
+        configuración ya normalizada sin volver a parsear el JSON.
+        """
 
-    def _read_config_file(self) -> Dict:
-        """Lee el archivo de configuración si existe."""
+        blob = self._read_config_file()
+        if self._cached_config is None or blob != self._config_blob:
+            self._cached_config = self._normalize_config(self._parse_config(blob))
+            self._config_blob = blob
+        return self._cached_config
 
-        if not self.config_file.exists():
-            return {}
+    def _read_config_file(self) -> Optional[bytes]:
+        """Lee el contenido crudo del archivo de configuración si existe."""
 
         try:
-            with open(self.config_file, "r", encoding="utf-8") as file:
-                return json.load(file)
+            return self.config_file.read_bytes()
+        except FileNotFoundError:
+            return None
         except Exception as exc:  # pragma: no cover - errores raros de lectura
+            self._log(f"❌ Error al leer configuración de programación: {exc}")
+            return None
+
+    def _parse_config(self, blob: Optional[bytes]) -> Dict:
+        """Decodifica el JSON de configuración (json.loads acepta bytes UTF-8)."""
+
+        if not blob:
+            return {}
+
+        try:
+            return json.loads(blob)
+        except Exception as exc:  # pragma: no cover - JSON inválido
             self._log(f"❌ Error al leer configuración de programación: {exc}")
             return {}
 
     def _normalize_config(self, raw_config: Optional[Dict]) -> Dict[str, Dict]:
         """Normaliza la configuración para asegurar llaves y valores válidos."""
 
-        default_config = {
-            "daily": {
-                "enabled": False,
-                "days": {day: False for day in self.DAY_ORDER},
-                "time": "08:00",
-            },
-            "weekly": {
-                "enabled": False,
-                "day": "friday",
-                "time": "16:00",
-            },
-            "monthly": {
-                "enabled": False,
-                "day": "1",
-                "time": "09:00",
-            },
-        }
+        # Cada extractor completa sus propios valores por defecto y, además de
+        # los valores textuales, guarda primitivas ya calculadas (máscara de
+        # días, índice de día y hora como tupla) para que el bucle del
+        # programador no tenga que volver a interpretarlas en cada ciclo
+        if not isinstance(raw_config, dict):
+            raw_config = {}
 
-        if not raw_config:
-            return default_config
-
-        config = default_config.copy()
-        config["daily"] = {**default_config["daily"], **self._extract_daily(raw_config)}
-        config["weekly"] = {
-            **default_config["weekly"],
-            **self._extract_weekly(raw_config.get("weekly")),
-        }
-        config["monthly"] = {
-            **default_config["monthly"],
-            **self._extract_monthly(raw_config.get("monthly")),
+        return {
+            "daily": self._extract_daily(raw_config),
+            "weekly": self._extract_weekly(raw_config.get("weekly")),
+            "monthly": self._extract_monthly(raw_config.get("monthly")),
         }
-        return config
 
     def _extract_daily(self, raw_config: Dict) -> Dict:
         """Extrae configuración diaria soportando formatos heredados."""
@@ -153,11 +279,20 @@ class UnifiedSchedulerService:
             source = raw_config
 
         enabled = bool(source.get("enabled", False))
-        time_value = self._sanitize_time(source.get("time"), default="08:00")
+        hour_minute = self._parse_time(source.get("time"), default=(8, 0))
         days_raw = source.get("days", {})
-        days = {day: bool(days_raw.get(day, False)) for day in self.DAY_ORDER}
+        # Los días se guardan solo como máscara: bit 0 = lunes ... bit 6 = domingo
+        days_mask = 0
+        for day, index in self._DAY_INDEX.items():
+            if days_raw.get(day, False):
+                days_mask |= 1 << index
 
-        return {"enabled": enabled, "time": time_value, "days": days}
+        return {
+            "enabled": enabled,
+            "time": self._format_time(hour_minute),
+            "hour_minute": hour_minute,
+            "days_mask": days_mask,
+        }
 
     def _extract_weekly(self, weekly_config: Optional[Dict]) -> Dict:
         """Extrae configuración semanal normalizada."""
@@ -166,15 +301,19 @@ class UnifiedSchedulerService:
             weekly_config = {}
 
         day = weekly_config.get("day", "friday")
-        if day not in self.DAY_ORDER:
+        weekday = self._DAY_INDEX.get(day) if isinstance(day, str) else None
+        if weekday is None:
             day = "friday"
+            weekday = self._DAY_INDEX[day]
 
-        time_value = self._sanitize_time(weekly_config.get("time"), default="16:00")
+        hour_minute = self._parse_time(weekly_config.get("time"), default=(16, 0))
 
         return {
             "enabled": bool(weekly_config.get("enabled", False)),
             "day": day,
-            "time": time_value,
+            "weekday": weekday,
+            "time": self._format_time(hour_minute),
+            "hour_minute": hour_minute,
         }
 
     def _extract_monthly(self, monthly_config: Optional[Dict]) -> Dict:
@@ -183,48 +322,45 @@ class UnifiedSchedulerService:
         if not isinstance(monthly_config, dict):
             monthly_config = {}
 
-        day_value = monthly_config.get("day", "1")
-        if isinstance(day_value, int):
-            day_value = str(day_value)
-
+        # El día se guarda como "last" o como entero en [1, 31]
+        day_value = monthly_config.get("day", 1)
         if isinstance(day_value, str):
-            day_value = day_value.strip() or "1"
+            day_value = day_value.strip()
             if day_value != "last":
                 try:
-                    number = int(day_value)
-                    if number < 1:
-                        number = 1
-                    if number > 31:
-                        number = 31
-                    day_value = str(number)
+                    day_value = int(day_value)
                 except ValueError:
-                    day_value = "1"
-        else:
-            day_value = "1"
+                    day_value = 1
+        if day_value != "last":
+            day_value = max(1, min(31, day_value)) if isinstance(day_value, int) else 1
 
-        time_value = self._sanitize_time(monthly_config.get("time"), default="09:00")
+        hour_minute = self._parse_time(monthly_config.get("time"), default=(9, 0))
 
         return {
             "enabled": bool(monthly_config.get("enabled", False)),
             "day": day_value,
-            "time": time_value,
+            "time": self._format_time(hour_minute),
+            "hour_minute": hour_minute,
         }
 
-    def _sanitize_time(self, value: Optional[str], default: str) -> str:
-        """Normaliza una cadena de hora en formato HH:MM."""
+    def _parse_time(self, value: Optional[str], default: tuple[int, int]) -> tuple[int, int]:
+        """Interpreta una hora "HH:MM" como (hora, minuto) acotados a rangos válidos."""
 
         if not value or not isinstance(value, str):
             return default
 
-        parts = value.split(":")
-        try:
-            hour = int(parts[0])
-            minute = int(parts[1]) if len(parts) > 1 else 0
-        except (TypeError, ValueError):
+        match = _TIME_PATTERN.fullmatch(value)
+        if not match:
             return default
 
-        hour = max(0, min(23, hour))
-        minute = max(0, min(59, minute))
+        hour = max(0, min(23, int(match.group(1))))
+        minute = max(0, min(59, int(match.group(2) or 0)))
+        return hour, minute
+
+    def _format_time(self, hour_minute: tuple[int, int]) -> str:
+        """Formatea (hora, minuto) como cadena HH:MM."""
+
+        hour, minute = hour_minute
         return f"{hour:02d}:{minute:02d}"
 
     # ------------------------------------------------------------------
@@ -236,7 +372,9 @@ class UnifiedSchedulerService:
         if self.thread and self.thread.is_alive():
             self.stop()
 
-        self.stop_event.clear()
+        with self._condition:
+            self._stop_requested = False
+            self._dirty = False
 
         self.thread = threading.Thread(
             target=self._run_scheduler,
@@ -255,24 +393,40 @@ class UnifiedSchedulerService:
             return
 
         self._log("🛑 Deteniendo programación automática...")
-        self.stop_event.set()
+        with self._condition:
+            self._stop_requested = True
+            self._condition.notify_all()
         self.thread.join(timeout=5)
         self.thread = None
         self.is_running = False
         self._log("🛑 Programación automática detenida")
 
     def restart(self) -> None:
-        """Recarga configuración y reinicia el hilo si es necesario."""
+        """Recarga configuración y reprograma el hilo si es necesario.
+
+        Si el hilo ya está activo no se recrea: se le notifica para que
+        recalcule las próximas ejecuciones con la nueva configuración.
+        """
 
         self._log("♻️ Reiniciando servicio de programación automática...")
-        self.stop()
-        self.current_config = self._load_config()
-        if self._any_frequency_enabled(self.current_config):
-            self._start_thread()
-        else:
+        config = self._load_config()
+        self._publish_state(config=config)
+        if not self._any_frequency_enabled(config):
+            self.stop()
             self._log(
                 "Programación automática desactivada tras la actualización de configuración"
             )
+        elif self.thread and self.thread.is_alive():
+            self._request_reschedule()
+        else:
+            self._start_thread()
+
+    def _request_reschedule(self) -> None:
+        """Despierta al hilo para que recalcule sus próximas ejecuciones."""
+
+        with self._condition:
+            self._dirty = True
+            self._condition.notify_all()
 
     # ------------------------------------------------------------------
     # Lógica principal del scheduler
@@ -283,63 +437,81 @@ class UnifiedSchedulerService:
         self._log("▶️ Bucle del programador unificado iniciado")
         consecutive_errors = 0
 
-        while not self.stop_event.is_set():
-            wait_seconds = 60  # Valor por defecto si no hay próximas ejecuciones
+        while True:
+            with self._condition:
+                if self._stop_requested:
+                    break
+                self._dirty = False
 
             try:
-                config = self._load_config()
-                self.current_config = config
+                # restart() y _setup_scheduler() publican la configuración antes
+                # de arrancar o despertar al hilo, así que aquí no se vuelve a
+                # leer el archivo en cada revisión
+                config = self._state.config
 
                 now = datetime.now()
+                now_mono = monotonic()
                 due_tasks = self._collect_due_tasks(config, now)
 
                 for frequency in due_tasks:
                     self._execute_task(frequency)
 
-                self.next_executions = self._calculate_next_executions(config, now)
-                wait_seconds = self._compute_sleep_interval(now, self.next_executions)
+                next_times, self._next_deadline_mono = self._compute_next_deadline(
+                    config, now, now_mono
+                )
+                if next_times is not self._state.next_executions:
+                    self._publish_state(next_executions=next_times)
                 consecutive_errors = 0
 
             except Exception as exc:  # pragma: no cover - fallos inesperados
                 consecutive_errors += 1
-                wait_seconds = min(300, 30 * consecutive_errors)
+                self._next_deadline_mono = monotonic() + min(300, 30 * consecutive_errors)
                 self._log(f"💥 Error en el bucle del programador: {exc}")
 
-            if self.stop_event.wait(wait_seconds):
-                break
+            self._flush_logs()
+            with self._condition:
+                # El plazo es monotónico: ajustes del reloj del sistema (NTP, cambio
+                # de hora, reanudar una VM) no alteran cuánto se duerme
+                timeout = None
+                if self._next_deadline_mono != _NO_DEADLINE:
+                    timeout = max(0.0, self._next_deadline_mono - monotonic())
+                self._condition.wait_for(
+                    lambda: self._stop_requested or self._dirty, timeout=timeout
+                )
 
         self._log("⏹️ Bucle del programador unificado finalizado")
+        self._flush_logs()
 
     def _collect_due_tasks(self, config: Dict[str, Dict], now: datetime) -> Iterable[str]:
         """Determina qué frecuencias deben ejecutarse en este instante."""
 
-        tolerance = timedelta(minutes=5)
+        tolerance = _RUN_TOLERANCE
         due_tasks = []
 
+        today = now.date()
+        weekday = now.weekday()
+
         # Diarios
-        daily = config.get("daily", {})
-        if daily.get("enabled"):
-            day_key = self.DAY_ORDER[now.weekday()]
-            if daily.get("days", {}).get(day_key, False):
-                scheduled = self._build_datetime_from_time(now.date(), daily.get("time", "08:00"))
-                if self._should_run("daily", scheduled, now, tolerance):
-                    due_tasks.append("daily")
+        daily = config["daily"]
+        if daily["enabled"] and daily["days_mask"] & (1 << weekday):
+            scheduled = self._build_datetime(today, daily["hour_minute"])
+            if self._should_run("daily", scheduled, now, tolerance):
+                due_tasks.append("daily")
 
         # Semanales
-        weekly = config.get("weekly", {})
-        if weekly.get("enabled"):
-            if weekly.get("day") == self.DAY_ORDER[now.weekday()]:
-                scheduled = self._build_datetime_from_time(now.date(), weekly.get("time", "16:00"))
-                if self._should_run("weekly", scheduled, now, tolerance, period="week"):
-                    due_tasks.append("weekly")
+        weekly = config["weekly"]
+        if weekly["enabled"] and weekly["weekday"] == weekday:
+            scheduled = self._build_datetime(today, weekly["hour_minute"])
+            if self._should_run("weekly", scheduled, now, tolerance):
+                due_tasks.append("weekly")
 
         # Mensuales
-        monthly = config.get("monthly", {})
-        if monthly.get("enabled"):
-            target_date = self._resolve_monthly_date(now.date(), monthly.get("day", "1"))
-            if target_date == now.date():
-                scheduled = self._build_datetime_from_time(target_date, monthly.get("time", "09:00"))
-                if self._should_run("monthly", scheduled, now, tolerance, period="month"):
+        monthly = config["monthly"]
+        if monthly["enabled"]:
+            target_date = self._resolve_monthly_date(today, monthly["day"])
+            if target_date == today:
+                scheduled = self._build_datetime(target_date, monthly["hour_minute"])
+                if self._should_run("monthly", scheduled, now, tolerance):
                     due_tasks.append("monthly")
 
         return due_tasks
@@ -350,7 +522,6 @@ class UnifiedSchedulerService:
         scheduled: datetime,
         now: datetime,
         tolerance: timedelta,
-        period: str = "day",
     ) -> bool:
         """Determina si se debe ejecutar una frecuencia determinada."""
 
@@ -361,130 +532,116 @@ class UnifiedSchedulerService:
             # Ya pasó demasiado tiempo, esperar a la próxima ventana
             return False
 
-        last_run = self.last_execution_times.get(frequency)
-        if not last_run:
-            return True
-
-        if period == "day":
-            return last_run.date() != now.date()
-        if period == "week":
-            return last_run.isocalendar()[:2] != now.isocalendar()[:2]
-        if period == "month":
-            return (last_run.year, last_run.month) != (now.year, now.month)
-
-        return True
-
-    def _calculate_next_executions(
-        self, config: Dict[str, Dict], now: datetime
-    ) -> Dict[str, Optional[datetime]]:
-        """Calcula la siguiente ejecución para cada frecuencia."""
-
-        next_times: Dict[str, Optional[datetime]] = {freq: None for freq in self.FREQUENCIES}
-
-        daily = config.get("daily", {})
-        if daily.get("enabled"):
-            next_times["daily"] = self._next_daily_execution(daily, now)
-
-        weekly = config.get("weekly", {})
-        if weekly.get("enabled"):
-            next_times["weekly"] = self._next_weekly_execution(weekly, now)
-
-        monthly = config.get("monthly", {})
-        if monthly.get("enabled"):
-            next_times["monthly"] = self._next_monthly_execution(monthly, now)
-
-        return next_times
-
-    def _compute_sleep_interval(
-        self, now: datetime, next_executions: Dict[str, Optional[datetime]]
-    ) -> int:
-        """Determina cuántos segundos debe dormir el hilo."""
+        # Solo una ejecución por periodo (día, semana o mes según la frecuencia)
+        return self._last_period_keys.get(frequency) != self._period_key(frequency, now)
+
+    def _period_key(self, frequency: str, moment: datetime) -> int:
+        """Identifica como entero el periodo de una frecuencia que contiene ``moment``."""
+
+        if frequency == "weekly":
+            # Ordinal del lunes de la semana: equivale a la semana ISO
+            return moment.toordinal() - moment.weekday()
+        if frequency == "monthly":
+            return moment.year * 12 + moment.month
+        return moment.toordinal()
+
+    def _record_execution(self, frequency: str, moment: datetime) -> None:
+        """Registra una ejecución exitosa y el periodo al que pertenece."""
+
+        with self._state_lock:
+            last_executions = self._state.last_executions._replace(**{frequency: moment})
+            self._state = self._state._replace(last_executions=last_executions)
+        self._last_period_keys[frequency] = self._period_key(frequency, moment)
+
+    def _compute_next_deadline(
+        self, config: Dict[str, Dict], now: datetime, now_mono: float
+    ) -> tuple[_FrequencyTimes, float]:
+        """Calcula la siguiente ejecución de cada frecuencia y el plazo
+        monotónico hasta el que debe dormir el hilo, en una sola pasada.
+
+        Si no hay ninguna ejecución próxima el plazo es ``_NO_DEADLINE``.
+        Con la misma configuración, si el reloj avanzó sin alcanzar ninguna de
+        las ejecuciones calculadas la vez anterior, estas siguen siendo válidas
+        y se reutilizan.
+        """
+
+        basis = self._next_basis
+        if (
+            basis is not None
+            and basis[0] is config
+            and basis[1] <= now
+            and all(moment is None or moment > now for moment in basis[2])
+        ):
+            next_times = basis[2]
+        else:
+            daily = config["daily"]
+            weekly = config["weekly"]
+            monthly = config["monthly"]
+            next_times = _FrequencyTimes(
+                self._next_daily_execution(daily, now) if daily["enabled"] else None,
+                self._next_weekly_execution(weekly, now) if weekly["enabled"] else None,
+                self._next_monthly_execution(monthly, now) if monthly["enabled"] else None,
+            )
+            self._next_basis = (config, now, next_times)
 
-        upcoming = [dt for dt in next_executions.values() if dt is not None]
-        if not upcoming:
-            return 60
+        earliest: Optional[datetime] = None
+        for moment in next_times:
+            if moment is not None and (earliest is None or moment < earliest):
+                earliest = moment
 
-        seconds_until_next = min((dt - now).total_seconds() for dt in upcoming)
-        if seconds_until_next <= 0:
-            return 30
+        if earliest is None:
+            # Nada programable: dormir hasta que restart() o stop() despierten al hilo
+            return next_times, _NO_DEADLINE
 
-        # Limitar a una hora para seguir revisando periódicamente
-        return int(max(30, min(seconds_until_next, 3600)))
+        # Despertar justo a la hora programada (al menos un segundo después,
+        # por la granularidad del temporizador) y no más de una hora después,
+        # para seguir revisando periódicamente
+        seconds_until_next = (earliest - now).total_seconds()
+        return next_times, now_mono + max(1.0, min(seconds_until_next, 3600))
 
     # ------------------------------------------------------------------
     # Helpers de cálculo de próximas ejecuciones
     # ------------------------------------------------------------------
-    def _build_datetime_from_time(self, target_date: date, time_str: str) -> datetime:
-        hour, minute = self._split_time(time_str, default=(0, 0))
-        return datetime.combine(target_date, datetime.min.time().replace(hour=hour, minute=minute))
-
-    def _split_time(self, value: str, default: tuple[int, int]) -> tuple[int, int]:
-        try:
-            parts = value.split(":")
-            hour = int(parts[0])
-            minute = int(parts[1]) if len(parts) > 1 else 0
-        except (ValueError, AttributeError, TypeError):
-            return default
-
-        hour = max(0, min(23, hour))
-        minute = max(0, min(59, minute))
-        return hour, minute
+    def _build_datetime(self, target_date: date, hour_minute: tuple[int, int]) -> datetime:
+        return _scheduled_datetime(target_date, hour_minute)
 
     def _next_daily_execution(self, daily: Dict, now: datetime) -> Optional[datetime]:
-        hour, minute = self._split_time(daily.get("time", "08:00"), default=(8, 0))
-        days_config = daily.get("days", {})
-
-        for offset in range(0, 7):
-            candidate_date = now.date() + timedelta(days=offset)
-            day_key = self.DAY_ORDER[(now.weekday() + offset) % 7]
-            if not days_config.get(day_key, False):
-                continue
-
-            candidate_datetime = datetime.combine(
-                candidate_date, datetime.min.time().replace(hour=hour, minute=minute)
-            )
-
-            if candidate_datetime <= now:
-                continue
-
-            return candidate_datetime
-
-        return None
+        days_mask = daily["days_mask"]
+        if not days_mask:
+            return None
+
+        # Rotar la máscara para que el bit 0 corresponda a hoy
+        weekday = now.weekday()
+        rotated = ((days_mask >> weekday) | (days_mask << (7 - weekday))) & 0x7F
+
+        today = now.date()
+        if rotated & 1:
+            candidate_datetime = self._build_datetime(today, daily["hour_minute"])
+            if candidate_datetime > now:
+                return candidate_datetime
+            # Hoy ya pasó la hora: si es el único día habilitado, toca en
+            # una semana (bit 7)
+            rotated = (rotated & ~1) | 0x80
+
+        # El bit activo más bajo es el siguiente día habilitado
+        offset = (rotated & -rotated).bit_length() - 1
+        return self._build_datetime(today + timedelta(days=offset), daily["hour_minute"])
 
     def _next_weekly_execution(self, weekly: Dict, now: datetime) -> Optional[datetime]:
-        hour, minute = self._split_time(weekly.get("time", "16:00"), default=(16, 0))
-        target_day = weekly.get("day", "friday")
-        if target_day not in self.DAY_ORDER:
-            target_day = "friday"
-
-        current_weekday = now.weekday()
-        target_weekday = self.DAY_ORDER.index(target_day)
-        days_ahead = (target_weekday - current_weekday) % 7
-        if days_ahead == 0:
-            candidate_date = now.date()
-        else:
-            candidate_date = now.date() + timedelta(days=days_ahead)
-
-        candidate_datetime = datetime.combine(
-            candidate_date, datetime.min.time().replace(hour=hour, minute=minute)
-        )
+        days_ahead = (weekly["weekday"] - now.weekday()) % 7
+        candidate_date = now.date() + timedelta(days=days_ahead)
+        candidate_datetime = self._build_datetime(candidate_date, weekly["hour_minute"])
 
         if candidate_datetime <= now:
-            candidate_date += timedelta(days=7)
-            candidate_datetime = datetime.combine(
-                candidate_date, datetime.min.time().replace(hour=hour, minute=minute)
-            )
+            candidate_datetime += timedelta(days=7)
 
         return candidate_datetime
 
     def _next_monthly_execution(self, monthly: Dict, now: datetime) -> Optional[datetime]:
-        hour, minute = self._split_time(monthly.get("time", "09:00"), default=(9, 0))
-        day_value = monthly.get("day", "1")
+        day_value = monthly["day"]
 
         candidate_date = self._resolve_monthly_date(now.date(), day_value)
-        candidate_datetime = datetime.combine(
-            candidate_date, datetime.min.time().replace(hour=hour, minute=minute)
-        )
+        candidate_datetime = self._build_datetime(candidate_date, monthly["hour_minute"])
 
         if candidate_datetime <= now:
             # Calcular para el mes siguiente
@@ -497,27 +654,17 @@ class UnifiedSchedulerService:
 
             next_date = date(next_year, next_month, 1)
             candidate_date = self._resolve_monthly_date(next_date, day_value)
-            candidate_datetime = datetime.combine(
-                candidate_date, datetime.min.time().replace(hour=hour, minute=minute)
-            )
+            candidate_datetime = self._build_datetime(candidate_date, monthly["hour_minute"])
 
         return candidate_datetime
 
-    def _resolve_monthly_date(self, reference_date: date, day_value: str) -> date:
+    def _resolve_monthly_date(self, reference_date: date, day_value: Union[int, str]) -> date:
         """Determina la fecha correcta para un reporte mensual."""
 
-        if day_value == "last":
-            last_day = calendar.monthrange(reference_date.year, reference_date.month)[1]
-            return date(reference_date.year, reference_date.month, last_day)
-
-        try:
-            day_num = int(day_value)
-        except (ValueError, TypeError):
-            day_num = 1
-
-        last_day = calendar.monthrange(reference_date.year, reference_date.month)[1]
-        day_num = max(1, min(last_day, day_num))
-        return date(reference_date.year, reference_date.month, day_num)
+        last_day = _days_in_month(reference_date.year, reference_date.month)
+        if isinstance(day_value, int):
+            last_day = min(last_day, day_value)
+        return date(reference_date.year, reference_date.month, last_day)
 
     # ------------------------------------------------------------------
     # Ejecución de tareas y utilidades públicas
@@ -525,57 +672,92 @@ class UnifiedSchedulerService:
     def _execute_task(self, frequency: str) -> bool:
         """Ejecuta el callback asociado a una frecuencia."""
 
+        # Solo se registran ejecuciones de las frecuencias conocidas
+        in_flight = self._in_flight.get(frequency)
+        if in_flight is None:
+            self._log(f"⚠️ Frecuencia desconocida: '{frequency}'")
+            return False
+
         callback = self.callbacks.get(frequency)
         if not callback:
             self._log(f"⚠️ No se encontró callback para la frecuencia '{frequency}'")
             return False
 
-        with self.lock:
-            self._log(f"⏰ Ejecutando tarea programada: {frequency}")
+        # Una misma frecuencia no se ejecuta dos veces a la vez (hilo del
+        # programador y force_execution): la segunda petición se descarta
+        if not in_flight.acquire(blocking=False):
+            self._log(f"⏳ La tarea programada '{frequency}' ya está en ejecución")
+            return False
+
+        self._log(f"⏰ Ejecutando tarea programada: {frequency}")
+        # El callback registra sus propios mensajes; se vacía el buffer antes
+        # para conservar el orden
+        self._flush_logs()
+        success = False
+        try:
+            success = bool(callback())
+        except Exception as exc:  # pragma: no cover - errores en callback
+            self._log(f"💥 Error ejecutando tarea {frequency}: {exc}")
+        finally:
             try:
-                success = bool(callback())
-            except Exception as exc:  # pragma: no cover - errores en callback
-                self._log(f"💥 Error ejecutando tarea {frequency}: {exc}")
-                success = False
-
-            if success:
-                self.last_execution_times[frequency] = datetime.now()
-                self._log(f"✅ Tarea programada '{frequency}' completada")
-            else:
-                self._log(f"❌ Tarea programada '{frequency}' finalizó con errores")
+                if success:
+                    self._record_execution(frequency, datetime.now())
+            finally:
+                in_flight.release()
+
+        if success:
+            self._log(f"✅ Tarea programada '{frequency}' completada")
+        else:
+            self._log(f"❌ Tarea programada '{frequency}' finalizó con errores")
 
-            return success
+        return success
 
     def force_execution(self, frequency: Optional[str] = None) -> bool:
         """Fuerza la ejecución inmediata de una o varias frecuencias."""
 
         if frequency:
-            return self._execute_task(frequency)
-
-        results = [self._execute_task(freq) for freq in self.FREQUENCIES]
-        return any(results)
+            success = self._execute_task(frequency)
+        else:
+            results = [self._execute_task(freq) for freq in self.FREQUENCIES]
+            success = any(results)
 
-    def get_status(self) -> Dict[str, Dict]:
-        """Retorna información del estado actual del scheduler."""
+        # Las ejecuciones forzadas cambian el último registro de cada frecuencia
+        if self.thread and self.thread.is_alive():
+            self._request_reschedule()
+        return success
+
+    def get_status(self) -> Dict[str, Union[bool, Mapping[str, Mapping]]]:
+        """Retorna información del estado actual del scheduler.
+
+        El detalle por frecuencia se reutiliza mientras el estado no cambie y
+        se entrega como vista de solo lectura, para que ningún llamador altere
+        la copia compartida.
+        """
+
+        # Una sola lectura de la instantánea: los tres campos son coherentes
+        state = self._state
+        cached = self._status_cache
+        if cached is not None and cached[0] is state:
+            frequencies = cached[1]
+        else:
+            frequencies = {}
+            for frequency, next_execution, last_execution in zip(
+                self.FREQUENCIES, state.next_executions, state.last_executions
+            ):
+                frequencies[frequency] = MappingProxyType({
+                    "enabled": state.config.get(frequency, {}).get("enabled", False),
+                    "next_execution": self._format_datetime(next_execution),
+                    "last_execution": self._format_datetime(last_execution),
+                })
+            frequencies = MappingProxyType(frequencies)
+            self._status_cache = (state, frequencies)
 
-        status: Dict[str, Dict] = {
+        return {
             "is_running": self.is_running,
             "thread_alive": bool(self.thread and self.thread.is_alive()),
-            "frequencies": {},
+            "frequencies": frequencies,
         }
 
-        for frequency in self.FREQUENCIES:
-            frequency_status = {
-                "enabled": self.current_config.get(frequency, {}).get("enabled", False),
-                "next_execution": self._format_datetime(self.next_executions.get(frequency)),
-                "last_execution": self._format_datetime(
-                    self.last_execution_times.get(frequency)
-                ),
-            }
-            status["frequencies"][frequency] = frequency_status
-
-        return status
-
     def _any_frequency_enabled(self, config: Dict[str, Dict]) -> bool:
         return any(config.get(freq, {}).get("enabled", False) for freq in self.FREQUENCIES)
 
@@ -583,8 +765,32 @@ class UnifiedSchedulerService:
         return value.isoformat() if value else None
 
     def _log(self, message: str) -> None:
-        if self.log_callback:
+        if not self.log_callback:
+            return
+        self._log_buf.append(message)
+        # Fuera del hilo del programador no hay un final de revisión que vacíe
+        # el buffer, así que se entrega de inmediato
+        if threading.current_thread() is not self.thread:
+            self._flush_logs()
+
+    def _flush_logs(self) -> None:
+        """Entrega los mensajes pendientes a log_callback, uno por llamada.
+
+        La interfaz antepone una marca de hora a cada llamada, así que los
+        mensajes no se unen en un solo texto.
+        """
+
+        messages = []
+        while self._log_buf:
+            try:
+                messages.append(self._log_buf.popleft())
+            except IndexError:  # vaciado por otro hilo
+                break
+        log_callback = self.log_callback
+        if not log_callback:
+            return
+        for message in messages:
             try:
-                self.log_callback(message)
+                log_callback(message)
             except Exception:
                 pass
@@ -0,0 +1,68 @@
+"""Tests for the Excel report generation service."""
+
+import csv
+from datetime import datetime
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from gui.models.search_profile import SearchProfile
+from services.report_service import ReportService
+
+
+def _build_profiles():
+    optimal = SearchProfile("Perfil Óptimo", ["criterio"], responsable="Ana")
+    optimal.bot_type = "automatico"
+    optimal.track_optimal = True
+    optimal.optimal_executions = 10
+    optimal.update_search_results(12)
+
+    untracked = SearchProfile("Perfil Manual", ["criterio"])
+    untracked.bot_type = "manual"
+
+    return [optimal, untracked]
+
+
+def test_daily_report_layout_is_readable_by_aggregation(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = ReportService()
+    assert not (tmp_path / "reports").exists()
+
+    report_path = service.generate_profiles_report(_build_profiles())
+
+    workbook = openpyxl.load_workbook(report_path)
+    assert workbook.sheetnames == ["Perfiles de Búsqueda", "Resumen"]
+
+    worksheet = workbook["Perfiles de Búsqueda"]
+    assert worksheet["A1"].value == "Reporte de Ejecuciones - Registro Diario"
+    assert worksheet["A4"].value == "Nombre del Perfil"
+    assert [cell.value for cell in worksheet[5]][:8] == [
+        "Perfil Óptimo", "Ana", "—", "—", 12, "🎯 10", "✅ 120.0%", "X"
+    ]
+    assert worksheet["G5"].fill.fgColor.rgb == "FF90EE90"
+    assert worksheet["K6"].value == "Nunca"
+
+    summary = workbook["Resumen"]
+    assert summary["A1"].value == "RESUMEN EJECUTIVO - DIARIO"
+    assert summary["B4"].value == 2
+
+    today = datetime.now().date()
+    weekly_data = service._process_weekly_reports(today, today)
+    assert weekly_data["reports_found"] == 1
+    assert weekly_data["aggregated_data"]["Perfil Óptimo"]["executions"] == 12
+    assert weekly_data["aggregated_data"]["Perfil Óptimo"]["weekly_optimal"] == 70
+    assert weekly_data["aggregated_data"]["Perfil Manual"]["is_manual"]
+
+
+def test_daily_report_can_be_written_as_csv(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = ReportService()
+
+    report_path = service.generate_profiles_report(_build_profiles(), fmt="csv")
+
+    with open(report_path, newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][0] == "Nombre del Perfil"
+    assert rows[1][:8] == ["Perfil Óptimo", "Ana", "—", "—", "12", "🎯 10", "✅ 120.0%", "X"]
+    assert rows[2][-1] == "Nunca"
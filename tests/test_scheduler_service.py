@@ -0,0 +1,260 @@
+"""Tests for the unified scheduler service."""
+
+import json
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.scheduler_service import UnifiedSchedulerService
+
+
+def _write_config(path, config):
+    path.write_text(json.dumps(config), encoding="utf-8")
+
+
+def test_load_config_reuses_parsed_config_until_content_changes(tmp_path):
+    config_file = tmp_path / "scheduler_config.json"
+    _write_config(config_file, {"weekly": {"enabled": False, "day": "monday", "time": "10:00"}})
+    service = UnifiedSchedulerService(config_file)
+    assert not service.is_running
+
+    first = service._load_config()
+    assert service._load_config() is first
+    assert first["weekly"]["day"] == "monday"
+
+    _write_config(config_file, {"weekly": {"enabled": False, "day": "tuesday", "time": "10:30"}})
+
+    reloaded = service._load_config()
+    assert reloaded is not first
+    assert reloaded["weekly"]["day"] == "tuesday"
+    assert reloaded["weekly"]["time"] == "10:30"
+
+
+def test_restart_reschedules_running_thread_without_recreating_it(tmp_path):
+    config_file = tmp_path / "scheduler_config.json"
+    _write_config(config_file, {"weekly": {"enabled": True, "day": "monday", "time": "10:00"}})
+    service = UnifiedSchedulerService(config_file)
+    try:
+        thread = service.thread
+        assert thread is not None and thread.is_alive()
+
+        _write_config(config_file, {"weekly": {"enabled": True, "day": "friday", "time": "16:00"}})
+        service.restart()
+
+        assert service.thread is thread
+        assert service.current_config["weekly"]["day"] == "friday"
+    finally:
+        service.stop()
+
+    assert not thread.is_alive()
+    assert not service.is_running
+
+
+def test_next_executions_use_precomputed_day_mask_and_time(tmp_path):
+    config_file = tmp_path / "scheduler_config.json"
+    _write_config(config_file, {
+        "daily": {"enabled": False, "days": {"monday": True, "thursday": True}, "time": "8:5"},
+        "weekly": {"enabled": False, "day": "wednesday", "time": "16:00"},
+        "monthly": {"enabled": False, "day": "31", "time": "09:00"},
+    })
+    service = UnifiedSchedulerService(config_file)
+    config = service._load_config()
+
+    assert config["daily"]["days_mask"] == 0b0001001
+    assert "days" not in config["daily"]
+    assert config["daily"]["hour_minute"] == (8, 5)
+    assert config["weekly"]["weekday"] == 2
+
+    # Miércoles 15/10/2025 a las 12:00
+    now = datetime(2025, 10, 15, 12, 0)
+    assert service._next_daily_execution(config["daily"], now) == datetime(2025, 10, 16, 8, 5)
+    assert service._next_weekly_execution(config["weekly"], now) == datetime(2025, 10, 15, 16, 0)
+    assert service._next_weekly_execution(
+        config["weekly"], datetime(2025, 10, 15, 17, 0)
+    ) == datetime(2025, 10, 22, 16, 0)
+    assert service._next_monthly_execution(config["monthly"], now) == datetime(2025, 10, 31, 9, 0)
+    assert service._next_monthly_execution(
+        config["monthly"], datetime(2025, 10, 31, 10, 0)
+    ) == datetime(2025, 11, 30, 9, 0)
+
+
+def test_should_run_once_per_period(tmp_path):
+    service = UnifiedSchedulerService(tmp_path / "scheduler_config.json")
+    tolerance = timedelta(minutes=5)
+    scheduled = datetime(2025, 12, 29, 9, 0)  # Lunes de la semana ISO 1 de 2026
+    now = scheduled + timedelta(minutes=1)
+
+    assert service._should_run("weekly", scheduled, now, tolerance)
+    service._record_execution("weekly", now)
+    assert not service._should_run("weekly", scheduled, now, tolerance)
+    assert service._should_run(
+        "weekly", scheduled + timedelta(days=7), now + timedelta(days=7), tolerance
+    )
+
+    service._record_execution("monthly", datetime(2025, 12, 1, 9, 1))
+    assert service._should_run("monthly", scheduled, now, tolerance) is False
+    assert service._should_run(
+        "monthly", datetime(2026, 1, 1, 9, 0), datetime(2026, 1, 1, 9, 2), tolerance
+    )
+
+
+def test_restart_skips_normalization_when_content_is_unchanged(tmp_path, monkeypatch):
+    config_file = tmp_path / "scheduler_config.json"
+    _write_config(config_file, {"weekly": {"enabled": False, "day": "monday", "time": "10:00"}})
+    service = UnifiedSchedulerService(config_file)
+    first = service.current_config
+
+    calls = []
+    monkeypatch.setattr(
+        UnifiedSchedulerService, "_normalize_config", lambda self, raw: calls.append(raw)
+    )
+    service.restart()
+
+    assert service.current_config is first
+    assert calls == []
+
+
+def test_next_deadline_is_relative_to_the_monotonic_clock(tmp_path):
+    service = UnifiedSchedulerService(tmp_path / "scheduler.json")
+    config = service._normalize_config({
+        "daily": {"enabled": True, "time": "09:10", "days": {"wednesday": True}},
+        "weekly": {"enabled": True, "day": "wednesday", "time": "12:00"},
+    })
+    now = datetime(2025, 10, 15, 9, 0)
+
+    next_times, deadline = service._compute_next_deadline(config, now, 1000.0)
+    assert next_times.daily == datetime(2025, 10, 15, 9, 10)
+    assert next_times.weekly == datetime(2025, 10, 15, 12, 0)
+    assert next_times.monthly is None
+    assert deadline == 1600.0
+
+    # Cerca de la hora programada se despierta justo a tiempo, no 30 s después
+    _, deadline = service._compute_next_deadline(config, datetime(2025, 10, 15, 9, 9, 50), 1000.0)
+    assert deadline == 1010.0
+
+    idle = service._normalize_config({})
+    assert service._compute_next_deadline(idle, now, 1000.0) == (
+        (None, None, None), float("inf")
+    )
+
+
+def test_monthly_day_is_normalized_to_int_or_last(tmp_path):
+    service = UnifiedSchedulerService(tmp_path / "scheduler.json")
+
+    def day_of(value):
+        return service._extract_monthly({"day": value})["day"]
+
+    assert [day_of(v) for v in ("15", " last ", "40", 0, "x", None)] == [15, "last", 31, 1, 1, 1]
+    assert service._resolve_monthly_date(datetime(2025, 2, 10).date(), 31).day == 28
+
+
+def test_scheduler_thread_logs_are_delivered_at_flush_one_per_call(tmp_path):
+    received = []
+    service = UnifiedSchedulerService(tmp_path / "scheduler.json", log_callback=received.append)
+    received.clear()
+
+    service._log("fuera del hilo")
+    assert received == ["fuera del hilo"]
+
+    service.thread = threading.current_thread()
+    service._log("uno")
+    service._log("dos")
+    assert received == ["fuera del hilo"]
+    service._flush_logs()
+    assert received == ["fuera del hilo", "uno", "dos"]
+
+
+def test_recording_an_execution_publishes_a_new_state_snapshot(tmp_path):
+    service = UnifiedSchedulerService(tmp_path / "scheduler.json")
+    before = service._state
+
+    service._record_execution("daily", datetime(2025, 10, 15, 8, 0))
+
+    assert before.last_executions.daily is None
+    assert service.last_execution_times["daily"] == datetime(2025, 10, 15, 8, 0)
+    assert service.get_status()["frequencies"]["daily"]["last_execution"] is not None
+
+
+def test_idle_scheduler_waits_without_timeout_until_stopped(tmp_path):
+    config_file = tmp_path / "scheduler_config.json"
+    _write_config(config_file, {"daily": {"enabled": True, "days": {}, "time": "08:00"}})
+    service = UnifiedSchedulerService(config_file)
+    thread = service.thread
+    assert thread.is_alive()
+
+    service.stop()
+    assert not thread.is_alive()
+    assert service.next_executions["daily"] is None
+
+
+def test_status_details_are_reused_until_the_state_changes(tmp_path):
+    service = UnifiedSchedulerService(tmp_path / "scheduler.json")
+
+    first = service.get_status()["frequencies"]
+    assert service.get_status()["frequencies"] is first
+    with pytest.raises(TypeError):
+        first["weekly"]["enabled"] = True
+    with pytest.raises(TypeError):
+        first["daily"] = {}
+
+    service._record_execution("weekly", datetime(2025, 10, 17, 16, 0))
+    updated = service.get_status()["frequencies"]
+    assert updated is not first
+    assert updated["weekly"]["last_execution"] == "2025-10-17T16:00:00"
+
+
+def test_same_frequency_is_not_executed_twice_concurrently(tmp_path):
+    nested_results = []
+
+    def daily_task():
+        # Simula una ejecución forzada mientras la programada sigue en curso
+        nested_results.append(service.force_execution("daily"))
+        return True
+
+    service = UnifiedSchedulerService(tmp_path / "scheduler.json", callbacks={"daily": daily_task})
+
+    assert service.force_execution("daily") is True
+    assert nested_results == [False]
+    assert service.last_execution_times["daily"] is not None
+    assert not service._in_flight["daily"].locked()
+
+
+def test_single_daily_day_rolls_over_to_next_week(tmp_path):
+    service = UnifiedSchedulerService(tmp_path / "scheduler.json")
+    config = service._normalize_config({
+        "daily": {"enabled": True, "time": "08:00", "days": {"wednesday": True}},
+    })
+
+    # Miércoles 15/10/2025 después de la hora programada
+    next_times, _ = service._compute_next_deadline(config, datetime(2025, 10, 15, 9, 0), 0.0)
+    assert next_times.daily == datetime(2025, 10, 22, 8, 0)
+
+
+def test_next_executions_are_reused_until_one_is_reached(tmp_path):
+    service = UnifiedSchedulerService(tmp_path / "scheduler.json")
+    config = service._normalize_config({
+        "weekly": {"enabled": True, "day": "friday", "time": "16:00"},
+    })
+
+    first, _ = service._compute_next_deadline(config, datetime(2025, 10, 15, 9, 0), 0.0)
+    later, _ = service._compute_next_deadline(config, datetime(2025, 10, 16, 9, 0), 0.0)
+    assert later is first
+
+    # El reloj retrocede: no se reutiliza lo calculado para un instante posterior
+    earlier, _ = service._compute_next_deadline(config, datetime(2025, 10, 1, 9, 0), 0.0)
+    assert earlier.weekly == datetime(2025, 10, 3, 16, 0)
+
+    after, _ = service._compute_next_deadline(config, datetime(2025, 10, 17, 16, 0), 0.0)
+    assert after.weekly == datetime(2025, 10, 24, 16, 0)
+
+
+def test_unknown_frequency_is_rejected_without_running_its_callback(tmp_path):
+    calls = []
+    service = UnifiedSchedulerService(
+        tmp_path / "scheduler.json", callbacks={"hourly": lambda: calls.append(1) or True}
+    )
+
+    assert service.force_execution("hourly") is False
+    assert calls == []
+    assert all(not lock.locked() for lock in service._in_flight.values())